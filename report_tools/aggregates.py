@@ -0,0 +1,76 @@
+# report_tools/aggregates.py
+import json
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from report_tools.fingerprints import file_digests, load_manifest, same_inputs, sha256_file
+from report_tools.processed import find_processed, load_processed
+from report_tools.word_groups import EQUIV_FILE, collapse_synonyms, load_synonym_index
+
+AGGREGATES_FILE = "aggregates.json"
+AGGREGATE_COLUMNS = ["matched_groups", "keyword_frequencies"]
+INPUT_KEYS = ("source", "synonyms")
+
+def count_rows(freq_dicts, group_lists, keywords: Counter, groups: Counter):
+    """Add a run of processed rows (typed form) to running keyword / group counters."""
+    for d in freq_dicts:
+        keywords.update(d)
+    for gs in group_lists:
+        groups.update(gs)
+
+def build_aggregates(keywords: Counter, groups: Counter, equiv_json: Path = EQUIV_FILE) -> dict:
+    """
+    A school's histogram inputs: keyword, group and synonym-collapsed counts (in
+    first-seen order, as the histograms sort them) plus the max of each.
+    """
+    collapsed = collapse_synonyms(keywords, load_synonym_index(equiv_json))
+    return {
+        "keywords": dict(keywords),
+        "groups": dict(groups),
+        "collapsed": dict(collapsed),
+        "maxima": {
+            "keywords": max(keywords.values(), default=0),
+            "groups": max(groups.values(), default=0),
+            "collapsed": max(collapsed.values(), default=0),
+        },
+    }
+
+def _save(path: Path, aggregates: dict):
+    # not write_manifest: key order is the histograms' tie order, so keep it
+    path.write_text(json.dumps(aggregates, indent=1, ensure_ascii=False), encoding="utf8")
+
+@lru_cache(maxsize=None)
+def _synonyms_digest(equiv_json: Path) -> str:
+    return sha256_file(equiv_json)
+
+def _inputs(proc_file: Path, equiv_json: Path, previous: dict) -> dict:
+    return {
+        "source": file_digests([proc_file], previous.get("source")),
+        "synonyms": _synonyms_digest(Path(equiv_json)),
+    }
+
+def write_aggregates(proc_dir: Path, aggregates: dict, equiv_json: Path = EQUIV_FILE, previous: dict = None):
+    """Store aggregates next to the processed file they were computed from."""
+    inputs = _inputs(find_processed(proc_dir), equiv_json, previous or {})
+    _save(proc_dir / AGGREGATES_FILE, {**aggregates, **inputs})
+
+def load_aggregates(proc_dir: Path, equiv_json: Path = EQUIV_FILE):
+    """
+    A school's aggregates, recomputed (and re-saved) when the processed file or
+    the synonym table no longer match the stored digests. None if there is no data.
+    """
+    proc_file = find_processed(proc_dir)
+    if proc_file is None:
+        return None
+    stored = load_manifest(proc_dir / AGGREGATES_FILE)
+    inputs = _inputs(proc_file, equiv_json, stored)
+    if same_inputs(stored, inputs, INPUT_KEYS):
+        return stored
+
+    df = load_processed(proc_dir, columns=AGGREGATE_COLUMNS)
+    keywords, groups = Counter(), Counter()
+    count_rows(df["keyword_frequencies"], df["matched_groups"], keywords, groups)
+    aggregates = build_aggregates(keywords, groups, equiv_json)
+    _save(proc_dir / AGGREGATES_FILE, {**aggregates, **inputs})
+    return {**aggregates, **inputs}
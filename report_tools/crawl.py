@@ -0,0 +1,68 @@
+# report_tools/crawl.py
+from collections import deque
+
+# per-school knobs a scraping config module may set at top level, next to
+# `config = SpiderConfig(...)`; they become that spider's custom_settings
+SPIDER_SETTINGS = (
+    "CONCURRENT_REQUESTS_PER_DOMAIN",
+    "DOWNLOAD_DELAY",
+    "AUTOTHROTTLE_TARGET_CONCURRENCY",
+    "HTTPCACHE_MAX_AGE",   # seconds a cached page is reused without revalidation
+)
+
+def spider_settings(module) -> dict:
+    """The SPIDER_SETTINGS a config module defines, ready for custom_settings."""
+    settings = {name: getattr(module, name) for name in SPIDER_SETTINGS if hasattr(module, name)}
+    if "AUTOTHROTTLE_TARGET_CONCURRENCY" in settings:
+        settings["AUTOTHROTTLE_ENABLED"] = True
+    return settings
+
+def with_settings(spidercls, overrides: dict):
+    """A subclass of spidercls whose custom_settings also carry overrides."""
+    if not overrides:
+        return spidercls
+    merged = {**(getattr(spidercls, "custom_settings", None) or {}), **overrides}
+    return type(spidercls.__name__, (spidercls,), {"custom_settings": merged})
+
+class CrawlScheduler:
+    """
+    Stands in for the CrawlerProcess handed to ScraperEngine.schedule().
+    Each crawl gets the current school's settings (set .overrides before
+    scheduling it), and at most max_active crawls run at once (0 = no cap);
+    the rest start as earlier ones finish.
+    """
+
+    def __init__(self, process, max_active: int = 0):
+        self.process = process
+        self.max_active = max_active
+        self.overrides = {}
+        self._pending = deque()
+        self._active = 0
+
+    def crawl(self, crawler_or_spidercls, *args, **kwargs):
+        from twisted.internet import defer
+
+        if isinstance(crawler_or_spidercls, type):
+            crawler_or_spidercls = with_settings(crawler_or_spidercls, self.overrides)
+        elif self.overrides:
+            print(f"   • warning: crawler already built, per-school settings not applied: {self.overrides}")
+        done = defer.Deferred()
+        self._pending.append((crawler_or_spidercls, args, kwargs, done))
+        self._start_next()
+        return done
+
+    def _start_next(self):
+        while self._pending and (not self.max_active or self._active < self.max_active):
+            spider, args, kwargs, done = self._pending.popleft()
+            self._active += 1
+            d = self.process.crawl(spider, *args, **kwargs)
+            d.addBoth(self._finished)
+            d.chainDeferred(done)
+
+    def _finished(self, result):
+        self._active -= 1
+        self._start_next()
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.process, name)
@@ -0,0 +1,65 @@
+# report_tools/fingerprints.py
+import hashlib
+import json
+from pathlib import Path
+
+FINGERPRINT_FILE = ".fingerprint.json"
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def sha256_json(obj) -> str:
+    """Digest of a JSON-serialisable object, independent of dict key order."""
+    return sha256_bytes(json.dumps(obj, sort_keys=True, default=str).encode("utf8"))
+
+def code_version(*paths: Path) -> str:
+    """Digest of the given source files, so editing the code invalidates old outputs."""
+    h = hashlib.sha256()
+    for p in paths:
+        h.update(Path(p).read_bytes())
+    return h.hexdigest()
+
+def file_digests(files, previous: dict = None) -> dict:
+    """
+    Map file name -> {size, mtime_ns, sha256}. A file whose size and mtime
+    match the previous entry reuses its stored hash instead of being re-read.
+    """
+    previous = previous or {}
+    digests = {}
+    for f in sorted(files):
+        st = f.stat()
+        old = previous.get(f.name)
+        if old and old.get("size") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+            digest = old["sha256"]
+        else:
+            digest = sha256_file(f)
+        digests[f.name] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+    return digests
+
+def load_manifest(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def write_manifest(path: Path, manifest: dict):
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf8")
+
+def _comparable(value):
+    # file_digests() entries compare by content hash; size/mtime are only a cache
+    if isinstance(value, dict) and value and all(isinstance(v, dict) and "sha256" in v for v in value.values()):
+        return {name: v["sha256"] for name, v in value.items()}
+    return value
+
+def same_inputs(old: dict, new: dict, keys) -> bool:
+    """True if both manifests agree on every key (an empty old manifest never matches)."""
+    if not old:
+        return False
+    return all(_comparable(old.get(k)) == _comparable(new.get(k)) for k in keys)
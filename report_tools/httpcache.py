@@ -0,0 +1,45 @@
+# report_tools/httpcache.py
+from pathlib import Path
+from time import time
+
+from scrapy.extensions.httpcache import RFC2616Policy, rfc1123_to_epoch
+
+# one subdirectory per spider, one entry per request fingerprint
+HTTP_CACHE_DIR = Path(__file__).parent.parent / "data" / "http_cache"
+
+CACHE_MODES = ("off", "on", "replay")
+
+class CatalogCachePolicy(RFC2616Policy):
+    """
+    RFC 2616 caching: stale pages are revalidated with their ETag /
+    Last-Modified, so unchanged ones come back as 304s. On top of that, a page
+    cached less than HTTPCACHE_MAX_AGE seconds ago (per school, 0 = off) is
+    served without asking the server at all.
+    """
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.max_age = settings.getint("HTTPCACHE_MAX_AGE")
+
+    def is_cached_response_fresh(self, cachedresponse, request) -> bool:
+        if self.max_age:
+            fetched = rfc1123_to_epoch(cachedresponse.headers.get(b"Date"))
+            if fetched is not None and time() - fetched < self.max_age:
+                return True
+        return super().is_cached_response_fresh(cachedresponse, request)
+
+def cache_settings(mode: str) -> dict:
+    """Crawler settings for an HTTP cache mode: off, on (revalidating) or replay (cache only)."""
+    if mode == "off":
+        return {}
+    settings = {
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_DIR": str(HTTP_CACHE_DIR),
+        "HTTPCACHE_EXPIRATION_SECS": 0,   # entries are kept for revalidation, never dropped
+        "HTTPCACHE_POLICY": "report_tools.httpcache.CatalogCachePolicy",
+    }
+    if mode == "replay":
+        # everything cached is served as is; anything not cached is skipped, not fetched
+        settings["HTTPCACHE_POLICY"] = "scrapy.extensions.httpcache.DummyPolicy"
+        settings["HTTPCACHE_IGNORE_MISSING"] = True
+    return settings
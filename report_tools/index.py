@@ -0,0 +1,159 @@
+# report_tools/index.py
+import sqlite3
+from pathlib import Path
+
+from report_tools.fingerprints import sha256_file
+from report_tools.processed import find_processed, load_processed
+from report_tools.word_groups import text_column
+
+INDEX_DB = Path(__file__).parent.parent / "data" / "course_index.sqlite"
+
+# processed_data column names (after process_data normalises them)
+TITLE_COLUMNS  = ("course_title", "title")
+DESC_COLUMNS   = ("course_description", "description")
+SOURCE_COLUMNS = ("source", "url")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS schools (
+    id       INTEGER PRIMARY KEY,
+    name     TEXT NOT NULL,
+    category TEXT NOT NULL,
+    digest   TEXT NOT NULL,
+    UNIQUE (category, name)
+);
+CREATE TABLE IF NOT EXISTS courses (
+    id          INTEGER PRIMARY KEY,
+    school_id   INTEGER NOT NULL REFERENCES schools(id) ON DELETE CASCADE,
+    title       TEXT,
+    description TEXT,
+    source      TEXT,
+    score       REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS groups (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS course_groups (
+    course_id INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    group_id  INTEGER NOT NULL REFERENCES groups(id),
+    PRIMARY KEY (group_id, course_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS course_keywords (
+    course_id  INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    keyword_id INTEGER NOT NULL REFERENCES keywords(id),
+    count      INTEGER NOT NULL,
+    PRIMARY KEY (keyword_id, course_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS courses_school ON courses (school_id);
+CREATE INDEX IF NOT EXISTS courses_score  ON courses (score DESC);
+CREATE INDEX IF NOT EXISTS course_groups_course   ON course_groups (course_id);
+CREATE INDEX IF NOT EXISTS course_keywords_course ON course_keywords (course_id);
+"""
+
+def connect(db_path: Path = INDEX_DB) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+def _ids(conn, table: str, names) -> dict:
+    """Get-or-create ids for names in a lookup table (groups / keywords)."""
+    names = sorted(set(names))
+    conn.executemany(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", [(n,) for n in names])
+    rows = conn.execute(f"SELECT name, id FROM {table}").fetchall()
+    return dict(rows)
+
+def keyword_count(kw: str, freqs: dict) -> int:
+    # frequencies are keyed by lower-cased phrase; a keyword may hold several
+    return sum(freqs.get(p.strip().lower(), 0) for p in kw.split(","))
+
+def index_school(conn, school_dir: Path, digest: str):
+    """Replace one school's courses and links in the index."""
+    category, name = school_dir.parent.name, school_dir.name
+    conn.execute("DELETE FROM schools WHERE category = ? AND name = ?", (category, name))
+    school_id = conn.execute(
+        "INSERT INTO schools (name, category, digest) VALUES (?, ?, ?)", (name, category, digest)
+    ).lastrowid
+
+    df = load_processed(school_dir / "processed_data")
+    titles  = text_column(df, TITLE_COLUMNS)
+    descs   = text_column(df, DESC_COLUMNS)
+    sources = text_column(df, SOURCE_COLUMNS)
+
+    group_ids = _ids(conn, "groups", (g for gs in df["matched_groups"] for g in gs))
+    keyword_ids = _ids(conn, "keywords", (k for ks in df["matched_keywords"] for k in ks))
+
+    course_groups, course_keywords = [], []
+    for title, desc, source, score, groups, kws, freqs in zip(
+        titles, descs, sources, df["relevance_score"],
+        df["matched_groups"], df["matched_keywords"], df["keyword_frequencies"],
+    ):
+        course_id = conn.execute(
+            "INSERT INTO courses (school_id, title, description, source, score) VALUES (?, ?, ?, ?, ?)",
+            (school_id, title, desc, source, float(score)),
+        ).lastrowid
+        course_groups += [(course_id, group_ids[g]) for g in set(groups)]
+        course_keywords += [(course_id, keyword_ids[k], keyword_count(k, freqs)) for k in set(kws)]
+
+    conn.executemany("INSERT INTO course_groups VALUES (?, ?)", course_groups)
+    conn.executemany("INSERT INTO course_keywords VALUES (?, ?, ?)", course_keywords)
+    return len(df)
+
+def build_index(schools_root: Path, db_path: Path = INDEX_DB, force: bool = False):
+    """
+    Bring the index up to date with every school's processed data. Schools whose
+    processed file digest is unchanged are left alone; removed schools are dropped.
+    """
+    conn = connect(db_path)
+    known = {(c, n): d for c, n, d in conn.execute("SELECT category, name, digest FROM schools")}
+    present = set()
+    updated = 0
+    for category in ("priority", "non_priority"):
+        cat_dir = schools_root / category
+        if not cat_dir.is_dir():
+            continue
+        for school in sorted(cat_dir.iterdir()):
+            if not school.is_dir():
+                continue
+            proc_file = find_processed(school / "processed_data")
+            if proc_file is None:
+                continue
+            present.add((category, school.name))
+            digest = sha256_file(proc_file)
+            if not force and known.get((category, school.name)) == digest:
+                continue
+            with conn:
+                n = index_school(conn, school, digest)
+            updated += 1
+            print(f"  – indexed {category}/{school.name}: {n} courses")
+
+    with conn:
+        for category, name in set(known) - present:
+            conn.execute("DELETE FROM schools WHERE category = ? AND name = ?", (category, name))
+            print(f"  – removed {category}/{name}")
+    print(f"Index up to date ({updated} school(s) reindexed) → {db_path}")
+    return conn
+
+def top_courses(conn, group: str = None, category: str = None, limit: int = 50):
+    """
+    Highest-scoring courses, optionally restricted to a keyword group (with or
+    without its weight suffix, e.g. "production" or "production-3") and a category.
+    """
+    sql = ["SELECT s.category, s.name, c.title, c.score FROM courses c JOIN schools s ON s.id = c.school_id"]
+    where, params = [], []
+    if group:
+        sql.append("JOIN course_groups cg ON cg.course_id = c.id JOIN groups g ON g.id = cg.group_id")
+        where.append("(g.name = ? OR g.name GLOB ? || '-[0-9]*')")
+        params += [group, group]
+    if category:
+        where.append("s.category = ?")
+        params.append(category)
+    if where:
+        sql.append("WHERE " + " AND ".join(where))
+    sql.append("ORDER BY c.score DESC LIMIT ?")
+    params.append(limit)
+    return conn.execute(" ".join(sql), params).fetchall()
@@ -0,0 +1,118 @@
+# report_tools/pdf_cache.py
+import sqlite3
+import zlib
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from report_tools.fingerprints import sha256_file, sha256_json
+from report_tools.pdf_extract import iter_pages_text, page_count
+
+PDF_CACHE = Path(__file__).parent.parent / "data" / "pdf_cache.sqlite"
+
+# distribution behind each backend; its version is part of the cache key
+BACKEND_PACKAGES = {"pdfminer": "pdfminer.six", "pypdf2": "PyPDF2", "pdfplumber": "pdfplumber"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pdfs (
+    path     TEXT PRIMARY KEY,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256   TEXT NOT NULL,
+    pages    INTEGER
+);
+CREATE TABLE IF NOT EXISTS pages (
+    pdf      TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    page     INTEGER NOT NULL,
+    text     BLOB NOT NULL,
+    PRIMARY KEY (pdf, settings, page)
+) WITHOUT ROWID;
+"""
+
+def connect(db_path: Path = PDF_CACHE) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=60)   # concurrent scrapers take turns writing
+    # readers never block the writer (or it them); writes are one short transaction each
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def settings_key(backend: str) -> str:
+    """Digest of the extractor settings: backend and the installed library version."""
+    try:
+        lib_version = version(BACKEND_PACKAGES[backend])
+    except (KeyError, PackageNotFoundError):
+        lib_version = None
+    return sha256_json({"backend": backend, "version": lib_version})
+
+def pdf_digest(conn, path: Path) -> str:
+    """Content hash of a PDF, re-read only when its size or mtime changes."""
+    path = Path(path).resolve()
+    st = path.stat()
+    row = conn.execute("SELECT size, mtime_ns, sha256 FROM pdfs WHERE path = ?", (str(path),)).fetchone()
+    if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+        return row[2]
+    digest = sha256_file(path)
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO pdfs VALUES (?, ?, ?, ?, NULL)",
+                     (str(path), st.st_size, st.st_mtime_ns, digest))
+    return digest
+
+def _page_count(conn, path: Path, backend: str) -> int:
+    pdf_digest(conn, path)   # (re)registers the file, resetting a stale count
+    path = Path(path).resolve()
+    row = conn.execute("SELECT pages FROM pdfs WHERE path = ?", (str(path),)).fetchone()
+    if row and row[0] is not None:
+        return row[0]
+    n = page_count(path, backend)
+    with conn:
+        conn.execute("UPDATE pdfs SET pages = ? WHERE path = ?", (n, str(path)))
+    return n
+
+def cached_page_count(path: Path, backend: str = "pdfminer", db_path: Path = PDF_CACHE) -> int:
+    """Number of pages in a PDF, remembered until the file changes."""
+    conn = connect(db_path)
+    try:
+        return _page_count(conn, path, backend)
+    finally:
+        conn.close()
+
+def iter_cached_pages_text(path: Path, pages=None, backend: str = "pdfminer", workers: int = 1,
+                           db_path: Path = PDF_CACHE, pool=None):
+    """
+    iter_pages_text() through a page cache keyed by PDF content, page and
+    extractor settings. Only pages never extracted before hit the PDF; pages
+    are yielded in order as they become available.
+    """
+    conn = connect(db_path)
+    try:
+        digest, settings = pdf_digest(conn, path), settings_key(backend)
+        if pages is None:
+            pages = range(_page_count(conn, path, backend))
+        pages = list(pages)
+
+        have = {p for (p,) in conn.execute(
+            "SELECT page FROM pages WHERE pdf = ? AND settings = ?", (digest, settings))}
+        fresh = iter_pages_text(path, [p for p in pages if p not in have], backend, workers, pool)
+        for p in pages:
+            if p in have:
+                (blob,) = conn.execute(
+                    "SELECT text FROM pages WHERE pdf = ? AND settings = ? AND page = ?", (digest, settings, p)
+                ).fetchone()
+                yield zlib.decompress(blob).decode("utf8")
+                continue
+            text = next(fresh)
+            # commit right away: no write lock is held while the next pages are
+            # extracted or the caller parses this one
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                             (digest, settings, p, zlib.compress(text.encode("utf8"))))
+            have.add(p)
+            yield text
+    finally:
+        conn.close()
+
+def cached_pages_text(path: Path, pages=None, backend: str = "pdfminer", workers: int = 1,
+                      db_path: Path = PDF_CACHE) -> list:
+    """All of iter_cached_pages_text() as a list."""
+    return list(iter_cached_pages_text(path, pages, backend, workers, db_path))
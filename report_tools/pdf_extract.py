@@ -0,0 +1,132 @@
+# report_tools/pdf_extract.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from itertools import repeat
+from pathlib import Path
+
+BACKENDS = ("pdfminer", "pypdf2", "pdfplumber")
+
+class PdfminerDoc:
+    """pdfminer.six text, page by page; pages joined equal extract_text() on the whole range."""
+
+    def __init__(self, path: Path):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        self._converter, self._laparams, self._interpreter = TextConverter, LAParams, PDFPageInterpreter
+        self._f = open(path, "rb")
+        self._pages = list(PDFPage.get_pages(self._f))
+        self._rsrcmgr = PDFResourceManager(caching=True)
+
+    def __len__(self):
+        return len(self._pages)
+
+    def text(self, i: int) -> str:
+        with StringIO() as out:
+            device = self._converter(self._rsrcmgr, out, laparams=self._laparams())
+            self._interpreter(self._rsrcmgr, device).process_page(self._pages[i])
+            return out.getvalue()
+
+    def close(self):
+        self._f.close()
+
+class PyPDF2Doc:
+    def __init__(self, path: Path):
+        from PyPDF2 import PdfReader
+        self._f = open(path, "rb")
+        self._pdf = PdfReader(self._f)
+
+    def __len__(self):
+        return len(self._pdf.pages)
+
+    def text(self, i: int) -> str:
+        return self._pdf.pages[i].extract_text() or ""
+
+    def close(self):
+        self._f.close()
+
+class PdfplumberDoc:
+    def __init__(self, path: Path):
+        import pdfplumber
+        self._pdf = pdfplumber.open(path)
+
+    def __len__(self):
+        return len(self._pdf.pages)
+
+    def text(self, i: int) -> str:
+        return self._pdf.pages[i].extract_text() or ""
+
+    def close(self):
+        self._pdf.close()
+
+def open_pdf(path: Path, backend: str = "pdfminer"):
+    """Open a PDF once for repeated per-page text extraction."""
+    docs = {"pdfminer": PdfminerDoc, "pypdf2": PyPDF2Doc, "pdfplumber": PdfplumberDoc}
+    if backend not in docs:
+        raise ValueError(f"unknown PDF backend {backend!r} (expected one of {BACKENDS})")
+    return docs[backend](Path(path))
+
+def page_count(path: Path, backend: str = "pdfminer") -> int:
+    doc = open_pdf(path, backend)
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+def _page_text(doc, i: int) -> str:
+    # one bad page shouldn't sink a multi-thousand-page catalog
+    try:
+        return doc.text(i)
+    except Exception as e:
+        print(f"   • warning: page {i + 1}: {e}")
+        return ""
+
+# each pool worker keeps the PDF it last served open, so consecutive chunks of
+# one document (the usual case) reuse it even when the pool is shared
+_worker_doc = _worker_key = None
+
+def _extract_chunk(path: str, backend: str, pages) -> list:
+    global _worker_doc, _worker_key
+    if _worker_key != (path, backend):
+        if _worker_doc is not None:
+            _worker_doc.close()
+        _worker_doc, _worker_key = open_pdf(path, backend), (path, backend)
+    return [_page_text(_worker_doc, i) for i in pages]
+
+def iter_pages_text(path: Path, pages=None, backend: str = "pdfminer", workers: int = 1, pool=None):
+    """
+    Yield the text of the given 0-based pages (default: all), in order, as soon
+    as each is ready. workers > 1 splits the pages into contiguous chunks over a
+    process pool (0 = one per CPU); pass pool to run them on an existing
+    ProcessPoolExecutor of that many workers instead of a private one.
+    """
+    if pages is None:
+        pages = range(page_count(path, backend))
+    pages = list(pages)
+    workers = workers or os.cpu_count() or 1
+
+    if pool is None and (workers <= 1 or len(pages) < 2):
+        doc = open_pdf(path, backend)
+        try:
+            for i in pages:
+                yield _page_text(doc, i)
+        finally:
+            doc.close()
+        return
+
+    # several chunks per worker so slow (dense) pages even out
+    size = max(1, -(-len(pages) // (workers * 4)))
+    chunks = [pages[i:i + size] for i in range(0, len(pages), size)]
+    if pool is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(_extract_chunk, repeat(str(path)), repeat(backend), chunks):
+                yield from chunk
+    else:
+        for chunk in pool.map(_extract_chunk, repeat(str(path)), repeat(backend), chunks):
+            yield from chunk
+
+def extract_pages_text(path: Path, pages=None, backend: str = "pdfminer", workers: int = 1) -> list:
+    """All of iter_pages_text() as a list."""
+    return list(iter_pages_text(path, pages, backend, workers))
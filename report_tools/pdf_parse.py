@@ -0,0 +1,77 @@
+# report_tools/pdf_parse.py
+import re
+
+# how far past a header match the text must reach before the match is trusted
+# (a header at the very end of what has been read may still grow with the next
+# page), and how much text is kept before the first header for one to straddle
+# a page break
+HEADER_TAIL = 256
+
+WHITESPACE = re.compile(r"\s+")
+
+def iter_lines(page_texts):
+    """Stripped lines of each page in turn; a line never runs across pages, blank pages give none."""
+    for text in page_texts:
+        if text:
+            for line in text.split("\n"):
+                yield line.strip()
+
+def iter_line_blocks(lines, header, anywhere: bool = False):
+    """
+    Yield (header match, following lines) for every line matching header, each
+    as soon as the next header (or the end) closes it. Lines before the first
+    header are dropped. With anywhere, every header.finditer() match in a line
+    opens a block, all of them sharing the lines that follow.
+    """
+    cur, body = [], []
+    for line in lines:
+        matches = list(header.finditer(line)) if anywhere else [m for m in [header.match(line)] if m]
+        if matches:
+            for m in cur:
+                yield m, body
+            cur, body = matches, []
+        elif cur:
+            body.append(line)
+    for m in cur:
+        yield m, body
+
+def collapse_whitespace(page_texts):
+    """re.sub(r"\\s+", " ", ...) over the concatenated pages, one page at a time."""
+    space = False   # whether the text so far ends in a collapsed run
+    for text in page_texts:
+        text = WHITESPACE.sub(" ", text)
+        if space and text.startswith(" "):
+            text = text[1:]
+        if text:
+            space = text.endswith(" ")
+            yield text
+
+def iter_text_blocks(page_texts, header, tail: int = HEADER_TAIL):
+    """
+    Yield (header match, body) for every header.finditer() match over the
+    concatenated page texts, body being the text up to the next match (or the
+    end). Blocks come out as soon as the following header has been read, and
+    only the open block (plus tail characters either side) is ever held.
+    """
+    buf, cur, pos = "", None, 0   # pos: end of the open header, or where to search next
+    for text in page_texts:
+        buf += text
+        while True:
+            m = header.search(buf, pos)
+            if m is None or len(buf) - m.end() < tail:
+                break
+            if cur is not None:
+                yield cur, buf[pos:m.start()]
+            cur, pos = m, m.end()
+        if cur is None:
+            # no block open yet: skip text no header can start in any more
+            pos = max(pos, min(len(buf) - tail, m.start() if m else len(buf)))
+        cut = max(0, pos - tail)   # leave context for lookbehinds and \b
+        buf, pos = buf[cut:], pos - cut
+
+    for m in header.finditer(buf, pos):
+        if cur is not None:
+            yield cur, buf[pos:m.start()]
+        cur, pos = m, m.end()
+    if cur is not None:
+        yield cur, buf[pos:]
@@ -0,0 +1,125 @@
+# report_tools/pdf_scraper.py
+import importlib.util
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from report_tools.pdf_cache import iter_cached_pages_text
+from report_tools.pdf_parse import collapse_whitespace, iter_line_blocks, iter_lines, iter_text_blocks
+from report_tools.records import JsonLinesWriter
+
+# schools/<priority|non_priority>/<school>/pdfs/pdf_config.py, defining `config = PdfConfig(...)`
+PDF_CONFIG = "pdf_config.py"
+
+@dataclass
+class PdfSection:
+    """
+    One run of courses laid out the same way. Courses start at each match of
+    header, and code / title are match.expand() templates over it.
+
+    layout "lines": header is matched at the start of each stripped line (or
+    anywhere, several per line); the lines up to the next header form the body.
+    layout "text": header is searched across the page texts joined by newlines
+    (whitespace collapsed first with collapse); the text up to the next header
+    forms the body.
+    """
+    header: str
+    pages: tuple = None          # 1-based, inclusive (first, last); None = whole document
+    layout: str = "lines"
+    code: str = r"\g<code>"
+    title: str = r"\g<title>"    # None: the title follows the header (see title_lines)
+    anywhere: bool = False       # lines: find every header in a line, not just at its start
+    title_lines: int = 2         # lines, title None: up to this many body lines, if short
+    description: bool = True     # lines: the body (see desc_after / desc_skip) is the description
+    desc_after: str = None       # lines: description starts after the first body line matching this
+    desc_skip: str = None        # lines: body lines matching this stay out of the description
+    record: str = None           # text: regex matched from each header (running on into following
+                                 # blocks until it does) with code / title / description groups
+    collapse: bool = False       # text: collapse whitespace runs to single spaces
+
+@dataclass
+class PdfConfig:
+    """PDF counterpart of the web SpiderConfig: which file, how to read it, where the courses are."""
+    name: str                    # raw_data/<name>.jsonl
+    pdf: str                     # file name inside the school's pdfs/ folder
+    sections: list = field(default_factory=list)
+    backend: str = "pdfminer"
+    unique: bool = False         # keep only the first course per code
+
+# longest a title taken from the following lines may be
+MAX_TITLE = 120
+
+def load_pdf_config(path: Path) -> PdfConfig:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.config
+
+def _line_courses(lines, section: PdfSection):
+    header = re.compile(section.header)
+    after = section.desc_after and re.compile(section.desc_after)
+    skip = section.desc_skip and re.compile(section.desc_skip)
+
+    for m, body in iter_line_blocks(lines, header, section.anywhere):
+        if section.title is None:
+            title = " ".join(body[:section.title_lines]).strip()
+            title = title if len(title) < MAX_TITLE else ""
+        else:
+            title = m.expand(section.title)
+        description = ""
+        if section.description:
+            if after:
+                starts = [i for i, line in enumerate(body) if after.match(line)]
+                body = body[starts[0] + 1:] if starts else []
+            description = " ".join(line for line in body if line and not (skip and skip.match(line)))
+        yield m.expand(section.code), title, description
+
+def _text_courses(texts, section: PdfSection):
+    texts = (text + "\n" for text in texts if text)
+    if section.collapse:
+        texts = collapse_whitespace(texts)
+    record = section.record and re.compile(section.record, re.DOTALL)
+
+    pending = ""
+    for m, body in iter_text_blocks(texts, re.compile(section.header)):
+        if record is None:
+            yield m.expand(section.code), body.strip() if section.title is None else m.expand(section.title), ""
+            continue
+        pending += m.group(0) + body
+        r = record.match(pending)
+        if not r:
+            continue
+        pending = ""
+        yield r.group("code"), r.group("title").strip(), re.sub(r"\s+", " ", r.group("description").strip())
+
+def iter_courses(pdf_path: Path, config: PdfConfig, workers: int = 1, pool=None):
+    """Yield raw course records (the web scraper's title / description schema) section by section."""
+    seen = set()
+    for section in config.sections:
+        pages = range(section.pages[0] - 1, section.pages[1]) if section.pages else None
+        texts = iter_cached_pages_text(pdf_path, pages, config.backend, workers, pool=pool)
+        courses = _line_courses(iter_lines(texts), section) if section.layout == "lines" \
+            else _text_courses(texts, section)
+        for code, title, description in courses:
+            code, title = code.strip(), title.strip()
+            if config.unique:
+                if code in seen:
+                    continue
+                seen.add(code)
+            yield {
+                "title": f"{code} - {title}" if title else code,
+                "description": description,
+                "source": Path(pdf_path).name,
+            }
+
+def scrape_school(school_dir: Path, config: PdfConfig, workers: int = 1, pool=None) -> int:
+    """Parse the school's PDF into raw_data/<config name>.jsonl; returns the number of courses."""
+    pdf_path = school_dir / "pdfs" / config.pdf
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"{pdf_path} not found")
+    n = 0
+    with JsonLinesWriter(school_dir / "raw_data" / f"{config.name}.jsonl") as out:
+        for record in iter_courses(pdf_path, config, workers, pool):
+            out.write(record)
+            n += 1
+    return n
@@ -0,0 +1,111 @@
+# report_tools/processed.py
+import json
+from pathlib import Path
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # parquet support is optional
+    pa = pq = None
+
+PROCESSED_CSV     = "processed.csv"
+PROCESSED_PARQUET = "processed.parquet"
+PROCESSED_JSON    = "processed.json"   # legacy record dumps
+
+LIST_COLUMNS = ("matched_keywords", "matched_groups")
+FREQ_COLUMN  = "keyword_frequencies"
+
+def parquet_available() -> bool:
+    return pq is not None
+
+def find_processed(proc_dir: Path):
+    """Return the processed file readers should use: parquet when readable, else CSV, else legacy JSON, else None."""
+    parquet = proc_dir / PROCESSED_PARQUET
+    if parquet_available() and parquet.exists():
+        return parquet
+    for name in (PROCESSED_CSV, PROCESSED_JSON):
+        if (proc_dir / name).exists():
+            return proc_dir / name
+    return None
+
+def _split(value) -> list:
+    return value.split(";") if isinstance(value, str) and value else []
+
+def _freqs(value) -> dict:
+    return json.loads(value) if isinstance(value, str) and value else {}
+
+def to_typed(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV form (";"-joined lists, JSON frequencies) -> Python lists and dicts."""
+    df = df.copy()
+    for col in LIST_COLUMNS:
+        if col in df:
+            df[col] = df[col].map(_split)
+    if FREQ_COLUMN in df:
+        df[FREQ_COLUMN] = df[FREQ_COLUMN].map(_freqs)
+    return df
+
+def to_flat(df: pd.DataFrame) -> pd.DataFrame:
+    """Typed form -> the CSV form written by process_data."""
+    df = df.copy()
+    for col in LIST_COLUMNS:
+        if col in df:
+            df[col] = df[col].map(";".join)
+    if FREQ_COLUMN in df:
+        df[FREQ_COLUMN] = df[FREQ_COLUMN].map(lambda d: json.dumps(d, ensure_ascii=False))
+    return df
+
+def write_parquet(df: pd.DataFrame, out_path: Path):
+    """
+    Write a CSV-form processed frame as parquet with typed columns:
+    list<string> for matched keywords/groups, map<string, int64> for frequencies.
+    """
+    typed = to_typed(df)
+    arrays = {}
+    for col in typed.columns:
+        if col in LIST_COLUMNS:
+            arrays[col] = pa.array(typed[col].tolist(), type=pa.list_(pa.string()))
+        elif col == FREQ_COLUMN:
+            arrays[col] = pa.array([list(d.items()) for d in typed[col]],
+                                   type=pa.map_(pa.string(), pa.int64()))
+        else:
+            arrays[col] = pa.Array.from_pandas(typed[col])
+    pq.write_table(pa.table(arrays), out_path)
+
+def read_processed(path: Path, typed: bool = True, columns=None) -> pd.DataFrame:
+    """
+    Read one processed file (parquet, CSV or legacy JSON records) by its suffix.
+    typed=True gives lists/dicts for the match columns; typed=False gives the CSV form.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        df = pq.read_table(path, columns=columns).to_pandas(maps_as_pydicts="strict")
+        for col in LIST_COLUMNS:
+            if col in df:
+                df[col] = df[col].map(list)
+        return df if typed else to_flat(df)
+    if path.suffix == ".json":
+        df = pd.read_json(path, orient="records")
+        if columns is not None:
+            df = df[[c for c in columns if c in df]]
+        # older dumps may hold real lists/dicts or already-joined strings
+        for col in LIST_COLUMNS:
+            if col in df:
+                df[col] = df[col].map(lambda v: ";".join(v) if isinstance(v, list) else v)
+        if FREQ_COLUMN in df:
+            df[FREQ_COLUMN] = df[FREQ_COLUMN].map(
+                lambda v: json.dumps(v, ensure_ascii=False) if isinstance(v, dict) else v)
+        return to_typed(df) if typed else df
+    df = pd.read_csv(path, usecols=columns)
+    return to_typed(df) if typed else df
+
+def load_processed(proc_dir: Path, typed: bool = True, columns=None):
+    """
+    Load a school's processed data, preferring processed.parquet over processed.csv
+    (and either over a legacy processed.json).
+    Returns None if the school has no processed data.
+    """
+    path = find_processed(proc_dir)
+    if path is None:
+        return None
+    return read_processed(path, typed, columns)
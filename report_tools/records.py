@@ -0,0 +1,147 @@
+# report_tools/records.py
+import json
+import re
+from itertools import islice
+from pathlib import Path
+
+_WS = re.compile(r"\s*")
+_DELIMS = ",] \t\r\n"
+
+class NotAListError(ValueError):
+    """Raised when a .json raw dump is not a top-level array."""
+
+def iter_json_array(f, chunk_size: int = 1 << 16):
+    """
+    Yield the elements of a top-level JSON array one at a time, reading the
+    file in chunks so only the current element is held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    state = "start"  # start -> first -> (value -> sep)* -> done
+
+    def more():
+        nonlocal buf, pos, eof
+        data = f.read(chunk_size)
+        buf, pos, eof = buf[pos:] + data, 0, not data
+
+    while True:
+        pos = _WS.match(buf, pos).end()
+        if pos >= len(buf):
+            if eof:
+                if state == "done":
+                    return
+                raise json.JSONDecodeError("unexpected end of data", buf, pos)
+            more()
+            continue
+
+        ch = buf[pos]
+        if state == "start":
+            if ch != "[":
+                raise NotAListError("top-level JSON value is not an array")
+            pos += 1
+            state = "first"
+        elif state in ("first", "value"):
+            if state == "first" and ch == "]":
+                pos += 1
+                state = "done"
+                continue
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more()
+                continue
+            is_number = isinstance(obj, (int, float)) and not isinstance(obj, bool)
+            if not eof and (end == len(buf) or (is_number and buf[end] not in _DELIMS)):
+                # a number or literal may continue in the next chunk
+                more()
+                continue
+            pos = end
+            state = "sep"
+            yield obj
+        elif state == "sep":
+            if ch == ",":
+                state = "value"
+            elif ch == "]":
+                state = "done"
+            else:
+                raise json.JSONDecodeError("expected ',' or ']'", buf, pos)
+            pos += 1
+        else:
+            raise json.JSONDecodeError("extra data after array", buf, pos)
+
+def iter_jsonl(f):
+    """Yield one record per non-blank line of a JSON Lines file."""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+def iter_records(path: Path):
+    """Stream course records from a raw dump: JSON Lines for .jsonl, else a JSON array."""
+    with open(path, "r", encoding="utf8") as f:
+        if path.suffix == ".jsonl":
+            yield from iter_jsonl(f)
+        else:
+            yield from iter_json_array(f)
+
+def chunked(iterable, size: int):
+    """Yield lists of up to size items."""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+class JsonLinesWriter:
+    """Write one JSON record per line, flushing as each arrives so a crash loses nothing."""
+
+    def __init__(self, path: Path, mode: str = "w"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self.path, mode, encoding="utf8")
+
+    def write(self, record: dict):
+        self._f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class JsonLinesPipeline:
+    """
+    Scrapy item pipeline writing each spider's items to <raw_data>/<spider name>.jsonl.
+
+    Registered by scripts/run_web_scrape.py --feed-format jsonl, which also sets
+    RAW_JSONL_DIRS (spider name -> raw_data directory) in the crawler settings.
+    """
+
+    def __init__(self, dirs: dict):
+        self.dirs = dirs
+        self.writers = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.settings.getdict("RAW_JSONL_DIRS"))
+
+    def open_spider(self, spider):
+        out_dir = self.dirs.get(spider.name)
+        if out_dir is None:
+            spider.logger.warning(f"no raw_data directory for spider {spider.name!r}; JSONL feed disabled")
+            return
+        self.writers[spider.name] = JsonLinesWriter(Path(out_dir) / f"{spider.name}.jsonl")
+
+    def process_item(self, item, spider):
+        writer = self.writers.get(spider.name)
+        if writer:
+            writer.write(dict(item))
+        return item
+
+    def close_spider(self, spider):
+        writer = self.writers.pop(spider.name, None)
+        if writer:
+            writer.close()
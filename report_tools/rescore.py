@@ -0,0 +1,106 @@
+# report_tools/rescore.py
+from pathlib import Path
+import numpy as np
+
+from report_tools.word_groups import KeywordMatcher
+
+PHRASE_COUNTS = "phrase_counts.npz"
+
+def phrase_count_entries(freq_dicts, matcher: KeywordMatcher, row_offset: int = 0):
+    """
+    COO entries (row, phrase index, occurrences) for a run of processed rows.
+
+    keyword_frequencies counts a phrase once per keyword that contains it, so
+    the raw occurrence count is the frequency divided by that multiplicity.
+    """
+    index = {p: i for i, p in enumerate(matcher.phrases)}
+    rows, cols, counts = [], [], []
+    for r, freqs in enumerate(freq_dicts, start=row_offset):
+        for phrase, freq in freqs.items():
+            rows.append(r)
+            cols.append(index[phrase])
+            counts.append(freq // len(matcher.phrase_to_kws[phrase]))
+    return rows, cols, counts
+
+def save_phrase_counts(path: Path, rows, cols, counts, phrases, n_rows: int):
+    np.savez_compressed(
+        path,
+        rows=np.asarray(rows, dtype=np.int32),
+        cols=np.asarray(cols, dtype=np.int32),
+        counts=np.asarray(counts, dtype=np.int32),
+        phrases=np.asarray(phrases, dtype=str),
+        n_rows=np.int64(n_rows),
+    )
+
+def load_phrase_counts(path: Path) -> dict:
+    with np.load(path) as z:
+        return {k: z[k] for k in z.files}
+
+def phrase_counts_from_frequencies(freq_dicts, matcher: KeywordMatcher) -> dict:
+    """
+    The phrase_counts.npz contents rebuilt from processed keyword_frequencies,
+    for schools whose raw data (and so the cache) is gone. Phrases matcher
+    doesn't know are taken to have come from a single keyword.
+    """
+    phrases = list(matcher.phrases)
+    index = {p: i for i, p in enumerate(phrases)}
+    rows, cols, counts = [], [], []
+    n_rows = 0
+    for r, freqs in enumerate(freq_dicts):
+        n_rows = r + 1
+        for phrase, freq in freqs.items():
+            if phrase not in index:
+                index[phrase] = len(phrases)
+                phrases.append(phrase)
+            rows.append(r)
+            cols.append(index[phrase])
+            counts.append(freq // max(1, len(matcher.phrase_to_kws.get(phrase, ()))))
+    return {
+        "rows": np.asarray(rows, dtype=np.int32),
+        "cols": np.asarray(cols, dtype=np.int32),
+        "counts": np.asarray(counts, dtype=np.int32),
+        "phrases": np.asarray(phrases, dtype=str),
+        "n_rows": np.int64(n_rows),
+    }
+
+def rescore(cache: dict, keyword_groups: dict, weights: dict = None):
+    """
+    Apply a taxonomy to cached phrase counts without touching the course text.
+
+    Returns (scores, hit, groups, missing): per-row scores, a rows x groups
+    boolean hit matrix, the group names, and taxonomy phrases the cache has no
+    counts for (new phrases need a real process-data run). weights overrides
+    group weights by group name, with or without the "-N" suffix.
+    """
+    matcher = KeywordMatcher(keyword_groups)
+    groups = matcher.groups
+    w = np.asarray(matcher.weights, dtype=float)
+    for gi, name in enumerate(groups):
+        base = name.rsplit("-", 1)[0] if name.rsplit("-", 1)[-1].isdigit() else name
+        for key in (name, base):
+            if weights and key in weights:
+                w[gi] = weights[key]
+
+    cached = [str(p) for p in cache["phrases"]]
+    missing = sorted(set(matcher.phrases) - set(cached))
+
+    # per cached phrase: multiplicity and group membership under the new taxonomy
+    mult = np.zeros(len(cached))
+    member = np.zeros((len(cached), len(groups)), dtype=bool)
+    for i, p in enumerate(cached):
+        kws = matcher.phrase_to_kws.get(p, [])
+        mult[i] = len(kws)
+        for ki in kws:
+            member[i, matcher.keywords[ki][0]] = True
+
+    n_rows = int(cache["n_rows"])
+    rows, cols, counts = cache["rows"], cache["cols"], cache["counts"]
+    live = mult[cols] > 0
+    rows, cols, counts = rows[live], cols[live], counts[live]
+
+    # a group is hit if any of its phrases occurs; add 0.5 per counted occurrence
+    hit = np.zeros((n_rows, len(groups)), dtype=bool)
+    np.logical_or.at(hit, rows, member[cols])
+    freq_term = 0.5 * np.bincount(rows, weights=counts * mult[cols], minlength=n_rows)
+    scores = hit @ w + freq_term
+    return scores, hit, groups, missing
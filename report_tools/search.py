@@ -0,0 +1,168 @@
+# report_tools/search.py
+import json
+import sqlite3
+from pathlib import Path
+
+from report_tools.fingerprints import file_digests, same_inputs
+from report_tools.index import DESC_COLUMNS, INDEX_DB, TITLE_COLUMNS
+from report_tools.processed import find_processed, load_processed
+from report_tools.records import NotAListError, chunked, iter_records
+from report_tools.word_groups import text_column
+
+# raw scraper keys, before process_data normalises them
+RAW_TITLE_KEYS = ("course title", "title")
+RAW_DESC_KEYS  = ("course description", "description")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fts_docs (
+    id          INTEGER PRIMARY KEY,
+    category    TEXT NOT NULL,
+    school      TEXT NOT NULL,
+    origin      TEXT NOT NULL,
+    title       TEXT,
+    description TEXT
+);
+CREATE INDEX IF NOT EXISTS fts_docs_school ON fts_docs (category, school);
+CREATE VIRTUAL TABLE IF NOT EXISTS course_fts USING fts5(
+    title, description,
+    content='fts_docs', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS fts_docs_ai AFTER INSERT ON fts_docs BEGIN
+    INSERT INTO course_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_docs_ad AFTER DELETE ON fts_docs BEGIN
+    INSERT INTO course_fts (course_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TABLE IF NOT EXISTS fts_sources (
+    category TEXT NOT NULL,
+    school   TEXT NOT NULL,
+    manifest TEXT NOT NULL,
+    PRIMARY KEY (category, school)
+);
+"""
+
+def connect(db_path: Path = INDEX_DB) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def _first(record: dict, keys) -> str:
+    for k in keys:
+        if record.get(k):
+            return str(record[k])
+    return ""
+
+def _school_source(school_dir: Path, previous: dict):
+    """
+    The text a school contributes: its full raw catalog when raw_data is still
+    around (so candidate terms can be tested on every course), else the
+    processed (already relevant) rows. Returns (manifest, files) or (None, []).
+    """
+    raw_dir = school_dir / "raw_data"
+    raw_files = [*raw_dir.glob("*.json"), *raw_dir.glob("*.jsonl")]
+    if raw_files:
+        origin, files = "raw", raw_files
+    else:
+        proc_file = find_processed(school_dir / "processed_data")
+        if proc_file is None:
+            return None, []
+        origin, files = "processed", [proc_file]
+    return {"origin": origin, "files": file_digests(files, previous.get("files"))}, files
+
+def _iter_docs(school_dir: Path, origin: str, files):
+    """Yield (title, description) for every course a school contributes."""
+    if origin == "processed":
+        df = load_processed(school_dir / "processed_data", typed=False)
+        yield from zip(text_column(df, TITLE_COLUMNS), text_column(df, DESC_COLUMNS))
+        return
+    for raw_file in files:
+        try:
+            for record in iter_records(raw_file):
+                if isinstance(record, dict):
+                    yield _first(record, RAW_TITLE_KEYS), _first(record, RAW_DESC_KEYS)
+        except (NotAListError, json.JSONDecodeError) as e:
+            print(f"   • warning: {school_dir.name}/{raw_file.name}: {e}, indexed what was readable")
+
+def update_search_index(schools_root: Path, db_path: Path = INDEX_DB, force: bool = False):
+    """Re-index the text of every school whose source files changed."""
+    conn = connect(db_path)
+    known = {
+        (c, s): json.loads(m)
+        for c, s, m in conn.execute("SELECT category, school, manifest FROM fts_sources")
+    }
+    present = set()
+    updated = 0
+    for category in ("priority", "non_priority"):
+        cat_dir = schools_root / category
+        if not cat_dir.is_dir():
+            continue
+        for school in sorted(cat_dir.iterdir()):
+            if not school.is_dir():
+                continue
+            key = (category, school.name)
+            previous = known.get(key, {})
+            manifest, files = _school_source(school, previous)
+            if manifest is None:
+                continue
+            present.add(key)
+            if not force and same_inputs(previous, manifest, ("origin", "files")):
+                continue
+            with conn:
+                conn.execute("DELETE FROM fts_docs WHERE category = ? AND school = ?", key)
+                n = 0
+                for chunk in chunked(_iter_docs(school, manifest["origin"], files), 5000):
+                    conn.executemany(
+                        "INSERT INTO fts_docs (category, school, origin, title, description) VALUES (?, ?, ?, ?, ?)",
+                        [(category, school.name, manifest["origin"], t, d) for t, d in chunk],
+                    )
+                    n += len(chunk)
+                conn.execute("INSERT OR REPLACE INTO fts_sources VALUES (?, ?, ?)",
+                             (category, school.name, json.dumps(manifest)))
+            updated += 1
+            print(f"  – indexed text for {category}/{school.name}: {n} {manifest['origin']} courses")
+
+    with conn:
+        for key in set(known) - present:
+            conn.execute("DELETE FROM fts_docs WHERE category = ? AND school = ?", key)
+            conn.execute("DELETE FROM fts_sources WHERE category = ? AND school = ?", key)
+    if updated:
+        print(f"Search index updated ({updated} school(s)) → {db_path}")
+    return conn
+
+def _filters(category: str = None, school: str = None):
+    where, params = [], []
+    if category:
+        where.append("d.category = ?")
+        params.append(category)
+    if school:
+        where.append("d.school = ?")
+        params.append(school)
+    return "".join(f" AND {w}" for w in where), params
+
+def search(conn, query: str, category: str = None, school: str = None, limit: int = 20):
+    """
+    Best-ranked courses for an FTS5 query: "quoted phrases", AND / OR / NOT,
+    parentheses, NEAR(a b, n) and prefix* terms.
+    """
+    extra, params = _filters(category, school)
+    sql = f"""
+        SELECT d.category, d.school, d.origin, d.title,
+               snippet(course_fts, 1, '[', ']', '…', 16)
+        FROM course_fts JOIN fts_docs d ON d.id = course_fts.rowid
+        WHERE course_fts MATCH ?{extra}
+        ORDER BY rank LIMIT ?
+    """
+    return conn.execute(sql, [query, *params, limit]).fetchall()
+
+def count_by_school(conn, query: str, category: str = None, school: str = None):
+    """Number of matching courses per school, most hits first."""
+    extra, params = _filters(category, school)
+    sql = f"""
+        SELECT d.category, d.school, count(*) AS hits
+        FROM course_fts JOIN fts_docs d ON d.id = course_fts.rowid
+        WHERE course_fts MATCH ?{extra}
+        GROUP BY d.category, d.school ORDER BY hits DESC, d.school
+    """
+    return conn.execute(sql, [query, *params]).fetchall()
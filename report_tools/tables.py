@@ -1,25 +1,48 @@
 # report_tools/tables.py
+import json
 import pandas as pd
 from pathlib import Path
 
-def create_relational_tables(raw_csv: Path, out_dir: Path):
+from report_tools.processed import FREQ_COLUMN, LIST_COLUMNS, load_processed, read_processed
+
+def list_relation(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """Link table (id, value) for a ";"-joined list column, one row per element."""
+    values = df[col].dropna().astype(str).str.split(";").explode().str.strip()
+    values = values[values != ""]
+    return pd.DataFrame({"id": values.index, col: values.values})
+
+def frequency_relation(df: pd.DataFrame, col: str = FREQ_COLUMN) -> pd.DataFrame:
+    """Link table (id, keyword, count) for the JSON keyword_frequencies column."""
+    items = df[col].dropna().map(json.loads).map(dict.items).map(list).explode().dropna()
+    pairs = pd.DataFrame(items.tolist(), columns=["keyword", "count"])
+    pairs.insert(0, "id", items.index)
+    return pairs
+
+def create_relational_tables(source, out_dir: Path):
     """
-    Read raw CSV, split out any list‑oriented columns into
-    separate relational tables, then save everything into out_dir.
+    Split the ";"-joined match columns (and the keyword frequencies) of a
+    processed table out into link tables, then save everything into out_dir.
+    source is a CSV-form DataFrame, a processed file (parquet / CSV / JSON), or
+    a processed_data directory. Free-text columns are left alone, whatever
+    punctuation they contain.
     """
-    df = pd.read_csv(raw_csv)
+    if isinstance(source, pd.DataFrame):
+        df = source
+    elif Path(source).is_dir():
+        df = load_processed(Path(source), typed=False)
+        if df is None:
+            raise FileNotFoundError(f"No processed data in {source}")
+    else:
+        df = read_processed(source, typed=False)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Example: if a column holds comma‑separated lists
-    for col in df.columns:
-        if df[col].dtype == object and df[col].str.contains(",").any():
-            relations = []
-            for idx, cell in df[col].dropna().items():
-                for val in map(str.strip, cell.split(",")):
-                    relations.append({"id": idx, col: val})
-            rel_df = pd.DataFrame(relations)
-            rel_df.to_csv(out_dir / f"{col}_relation.csv", index=False)
+    for col in LIST_COLUMNS:
+        if col in df:
+            list_relation(df, col).to_csv(out_dir / f"{col}_relation.csv", index=False)
             print(f"  – relational table: {col}_relation.csv")
+    if FREQ_COLUMN in df:
+        frequency_relation(df).to_csv(out_dir / f"{FREQ_COLUMN}_relation.csv", index=False)
+        print(f"  – relational table: {FREQ_COLUMN}_relation.csv")
 
     df.to_csv(out_dir / "main_table.csv", index=False)
     print(f"  – main table: main_table.csv")
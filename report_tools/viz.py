@@ -3,11 +3,51 @@ import matplotlib.pyplot as plt
 import plotly.express as px
 from pathlib import Path
 
-def heatmap(main_csv: Path, relations_dir: Path, out_html: Path):
-    df_main = pd.read_csv(main_csv)
-    # load relations if needed…
-    fig = px.imshow([[0]], title="(placeholder)")
-    # …build real static figures here
+from report_tools.aggregates import load_aggregates
+from report_tools.word_groups import EQUIV_FILE, load_keyword_groups
+
+def school_group_matrix(schools_root: Path, equiv_json: Path = EQUIV_FILE) -> pd.DataFrame:
+    """
+    Courses matching each keyword group, per school: rows "category/school",
+    columns in taxonomy order. Built from the per-school aggregates, so no
+    course rows are loaded.
+    """
+    counts = {}
+    for category in ("priority", "non_priority"):
+        cat_dir = schools_root / category
+        if not cat_dir.is_dir():
+            continue
+        for school in sorted(cat_dir.iterdir()):
+            agg = load_aggregates(school / "processed_data", equiv_json)
+            if agg is not None:
+                counts[f"{category}/{school.name}"] = agg["groups"]
+
+    matrix = pd.DataFrame.from_dict(counts, orient="index")
+    taxonomy = list(load_keyword_groups())
+    columns = [g for g in taxonomy if g in matrix] + [g for g in matrix if g not in taxonomy]
+    return matrix.reindex(columns=columns).fillna(0).astype(int)
+
+def heatmap(schools_root: Path, out_html: Path, matrix_csv: Path = None):
+    """
+    Interactive school x keyword-group heatmap of matching course counts.
+    The matrix itself is also written to matrix_csv when given.
+    """
+    matrix = school_group_matrix(schools_root)
+    if matrix.empty:
+        print("No processed data found; heatmap not written")
+        return
+    if matrix_csv:
+        matrix.to_csv(matrix_csv, index_label="school")
+        print(f"Saved school x group matrix to {matrix_csv}")
+
+    fig = px.imshow(
+        matrix,
+        labels=dict(x="Keyword group", y="School", color="Courses"),
+        color_continuous_scale="Blues",
+        aspect="auto",
+        title="Relevant courses per keyword group",
+    )
+    fig.update_layout(height=max(500, 18 * len(matrix) + 250))
     fig.write_html(out_html)
     print(f"Saved heatmap to {out_html}")
 
@@ -0,0 +1,129 @@
+# report_tools/warehouse.py
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from report_tools.fingerprints import load_manifest, sha256_file, write_manifest
+from report_tools.index import DESC_COLUMNS, SOURCE_COLUMNS, TITLE_COLUMNS, keyword_count
+from report_tools.processed import find_processed, load_processed
+from report_tools.word_groups import text_column
+
+WAREHOUSE_DIR = Path(__file__).parent.parent / "data" / "relational_output" / "warehouse"
+
+# per-school partitions; each directory reads back as one table
+FACT_TABLES = ("courses", "course_groups", "course_keywords")
+
+# course ids are (school_id << 32) | row, so they never collide across schools
+# and stay put while a school's processed data is unchanged
+COURSE_ID_SHIFT = 32
+
+# highest school_id ever issued, so a removed school's id (and course id
+# range) is never handed to another school
+META_FILE = "warehouse.json"
+
+def _read(path: Path, columns) -> pd.DataFrame:
+    return pd.read_parquet(path) if path.exists() else pd.DataFrame(columns=columns)
+
+def _write(df: pd.DataFrame, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")   # dot files are ignored by dataset readers
+    df.to_parquet(tmp, index=False)
+    tmp.replace(path)
+
+def _partition(out_dir: Path, table: str, school_id: int) -> Path:
+    return out_dir / table / f"school_{school_id:05d}.parquet"
+
+def _register(lookup: pd.DataFrame, key: str, names) -> pd.DataFrame:
+    """Append ids for names not seen before; existing ids never change."""
+    known = set(lookup["name"])
+    new = sorted(set(names) - known)
+    if not new:
+        return lookup
+    start = int(lookup[key].max()) + 1 if len(lookup) else 1
+    added = pd.DataFrame({key: range(start, start + len(new)), "name": new})
+    return pd.concat([lookup, added], ignore_index=True).astype({key: "int64"})
+
+def school_tables(df: pd.DataFrame, school_id: int, group_ids: dict, keyword_ids: dict):
+    """courses, course_groups and course_keywords rows for one school's typed processed frame."""
+    course_ids = (school_id << COURSE_ID_SHIFT) + np.arange(len(df), dtype=np.int64)
+    courses = pd.DataFrame({
+        "course_id": course_ids,
+        "school_id": school_id,
+        "title": text_column(df, TITLE_COLUMNS).to_numpy(),
+        "description": text_column(df, DESC_COLUMNS).to_numpy(),
+        "source": text_column(df, SOURCE_COLUMNS).to_numpy(),
+        "score": df["relevance_score"].astype(float).to_numpy(),
+    })
+
+    links = df.assign(course_id=course_ids)
+    groups = links[["course_id", "matched_groups"]].explode("matched_groups").dropna().drop_duplicates()
+    course_groups = pd.DataFrame({
+        "course_id": groups["course_id"].to_numpy(),
+        "group_id": groups["matched_groups"].map(group_ids).to_numpy(),
+    }).astype("int64")
+
+    kws = links[["course_id", "matched_keywords", "keyword_frequencies"]].explode("matched_keywords")
+    kws = kws.dropna(subset=["matched_keywords"]).drop_duplicates(subset=["course_id", "matched_keywords"])
+    course_keywords = pd.DataFrame({
+        "course_id": kws["course_id"].to_numpy(),
+        "keyword_id": kws["matched_keywords"].map(keyword_ids).to_numpy(),
+        "count": [keyword_count(k, f) for k, f in zip(kws["matched_keywords"], kws["keyword_frequencies"])],
+    }).astype("int64")
+    return {"courses": courses, "course_groups": course_groups, "course_keywords": course_keywords}
+
+def build_warehouse(schools_root: Path, out_dir: Path = WAREHOUSE_DIR, force: bool = False):
+    """
+    Bring the cross-school parquet dataset up to date: schools / groups / keywords
+    dimension tables plus per-school partitions of the courses and link tables.
+    Only schools whose processed file digest changed are rewritten.
+    """
+    schools = _read(out_dir / "schools.parquet", ["school_id", "category", "name", "digest"])
+    groups = _read(out_dir / "groups.parquet", ["group_id", "name"])
+    keywords = _read(out_dir / "keywords.parquet", ["keyword_id", "name"])
+    meta = load_manifest(out_dir / META_FILE)
+    known = {(c, n): (int(i), d) for i, c, n, d in schools.itertuples(index=False)}
+    next_id = max(meta.get("max_school_id", 0), int(schools["school_id"].max()) if len(schools) else 0) + 1
+
+    rows, updated = [], 0
+    for category in ("priority", "non_priority"):
+        cat_dir = schools_root / category
+        if not cat_dir.is_dir():
+            continue
+        for school in sorted(cat_dir.iterdir()):
+            proc_file = find_processed(school / "processed_data")
+            if proc_file is None:
+                continue
+            school_id, old_digest = known.get((category, school.name), (None, None))
+            if school_id is None:
+                school_id, next_id = next_id, next_id + 1
+            digest = sha256_file(proc_file)
+            rows.append((school_id, category, school.name, digest))
+            partitions_ok = all(_partition(out_dir, t, school_id).exists() for t in FACT_TABLES)
+            if not force and digest == old_digest and partitions_ok:
+                continue
+
+            df = load_processed(school / "processed_data")
+            groups = _register(groups, "group_id", (g for gs in df["matched_groups"] for g in gs))
+            keywords = _register(keywords, "keyword_id", (k for ks in df["matched_keywords"] for k in ks))
+            tables = school_tables(
+                df, school_id,
+                dict(zip(groups["name"], groups["group_id"])),
+                dict(zip(keywords["name"], keywords["keyword_id"])),
+            )
+            for table, frame in tables.items():
+                _write(frame, _partition(out_dir, table, school_id))
+            updated += 1
+            print(f"  – warehoused {category}/{school.name}: {len(df)} courses")
+
+    present = {r[0] for r in rows}
+    for school_id, category, name, _ in schools.itertuples(index=False):
+        if school_id not in present:
+            for table in FACT_TABLES:
+                _partition(out_dir, table, int(school_id)).unlink(missing_ok=True)
+            print(f"  – removed {category}/{name}")
+
+    _write(pd.DataFrame(rows, columns=["school_id", "category", "name", "digest"]), out_dir / "schools.parquet")
+    _write(groups, out_dir / "groups.parquet")
+    _write(keywords, out_dir / "keywords.parquet")
+    write_manifest(out_dir / META_FILE, {**meta, "max_school_id": next_id - 1})
+    print(f"Warehouse up to date ({updated} school(s) rewritten) → {out_dir}")
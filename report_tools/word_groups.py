@@ -2,10 +2,13 @@
 import json
 import re
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 KEYWORD_FILE = Path(__file__).parent.parent / "data" / "word_groups" / "current_keyword_groups.json"
+EQUIV_FILE   = Path(__file__).parent.parent / "data" / "word_groups" / "unique_word_groups.json"
 
 def compile_equivalencies(xlsx_path: Path, out_json: Path):
     df = pd.read_excel(xlsx_path, sheet_name=0)
@@ -34,36 +37,232 @@ def load_keyword_groups():
     with open(KEYWORD_FILE, "r", encoding="utf8") as f:
         return json.load(f)
 
+@lru_cache(maxsize=None)
+def load_synonym_index(equiv_json: Path = EQUIV_FILE) -> dict:
+    """
+    Reverse index of unique_word_groups.json: keyword -> canonical form.
+    A keyword listed under several masters maps to the first one.
+    """
+    mapping = json.loads(Path(equiv_json).read_text(encoding="utf8"))
+    index = {}
+    for master, group in mapping.items():
+        for kw in group:
+            index.setdefault(kw, master)
+    return index
+
+def collapse_synonyms(counts: Counter, synonyms: dict) -> Counter:
+    """Merge aggregated keyword counts onto their canonical forms."""
+    collapsed = Counter()
+    for kw, cnt in counts.items():
+        collapsed[synonyms.get(kw, kw)] += cnt
+    return collapsed
+
 def extract_group_weight(group_name: str) -> int:
     m = re.search(r"-([0-9]+)$", group_name)
     return int(m.group(1)) if m else 1
 
-def calculate_score_and_matches(title: str, description: str):
-    keyword_groups = load_keyword_groups()
-    text = f"{title} {description}".lower()
-    score = 0.0
-    matched = []
-    groups = []
-    freqs = Counter()
-
-    for group_name, keywords in keyword_groups.items():
-        weight = extract_group_weight(group_name)
-        hit = False
-        for kw in keywords:
-            parts = [p.strip().lower() for p in kw.split(",")]
-            if any(p in text for p in parts):
-                hit = True
-                matched.append(kw)
+def _trie_pattern(phrases) -> str:
+    """
+    Build a regex alternation factored by common prefixes, so the engine
+    walks a trie instead of retrying every phrase at every position.
+    Longer continuations are tried first, giving the longest phrase at a position.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """
+    Keyword groups compiled once into a single trie regex plus lookup tables.
+
+    One scan over the text finds the longest phrase starting at each position;
+    shorter phrases sharing that start are recovered from a prefix table, and
+    only phrases actually present are counted. Results are identical to the
+    original per-phrase loop (str.count semantics, taxonomy order).
+    """
+
+    def __init__(self, keyword_groups: dict):
+        self.groups = list(keyword_groups)
+        self.weights = [extract_group_weight(g) for g in self.groups]
+
+        # every keyword in taxonomy order: (group index, keyword, its phrase parts)
+        self.keywords = []
+        phrase_to_kws = {}
+        for gi, group_name in enumerate(self.groups):
+            for kw in keyword_groups[group_name]:
+                parts = [p.strip().lower() for p in kw.split(",")]
+                parts = [p for p in parts if p]
+                ki = len(self.keywords)
+                self.keywords.append((gi, kw, parts))
                 for p in parts:
-                    cnt = text.count(p)
-                    if cnt:
-                        freqs[p] += cnt
-        if hit:
-            score += weight
-            groups.append(group_name)
-
-    # add 0.5 per occurrence
-    for _, cnt in freqs.items():
-        score += cnt * 0.5
-
-    return score, list(set(matched)), list(set(groups)), dict(freqs)
+                    phrase_to_kws.setdefault(p, []).append(ki)
+        self.phrase_to_kws = phrase_to_kws
+
+        self.phrases = phrases = sorted(phrase_to_kws)
+        self.prefixes = {
+            p: [q for q in phrases if q != p and p.startswith(q)] for p in phrases
+        }
+        self.trie = _trie_pattern(phrases) if phrases else None
+        self.pattern = re.compile(f"(?=({self.trie}))") if phrases else None
+
+    def present_phrases(self, text: str) -> set:
+        """Return every phrase occurring in (already lower-cased) text."""
+        if self.pattern is None:
+            return set()
+        found = set()
+        for m in self.pattern.finditer(text):
+            p = m.group(1)
+            if p and p not in found:
+                found.add(p)
+                found.update(self.prefixes[p])
+        return found
+
+    def score_text(self, text: str):
+        present = self.present_phrases(text)
+        if not present:
+            return 0.0, [], [], {}
+
+        hit_kws = sorted({ki for p in present for ki in self.phrase_to_kws[p]})
+        counts = {p: text.count(p) for p in present}
+
+        score = 0.0
+        groups = []
+        for gi in dict.fromkeys(self.keywords[ki][0] for ki in hit_kws):
+            score += self.weights[gi]
+            groups.append(self.groups[gi])
+
+        matched = []
+        freqs = Counter()
+        for ki in hit_kws:
+            _, kw, parts = self.keywords[ki]
+            matched.append(kw)
+            for p in parts:
+                cnt = counts.get(p, 0)
+                if cnt:
+                    freqs[p] += cnt
+
+        # add 0.5 per occurrence
+        for _, cnt in freqs.items():
+            score += cnt * 0.5
+
+        return score, list(dict.fromkeys(matched)), groups, dict(freqs)
+
+    def score(self, title: str, description: str):
+        return self.score_text(f"{title} {description}".lower())
+
+@lru_cache(maxsize=None)
+def load_matcher() -> KeywordMatcher:
+    """Compile current_keyword_groups.json once per process."""
+    return KeywordMatcher(load_keyword_groups())
+
+def calculate_score_and_matches(title: str, description: str):
+    return load_matcher().score(title, description)
+
+def text_column(df: pd.DataFrame, cols) -> pd.Series:
+    """First non-empty value among cols (a name or sequence of names), as str."""
+    if isinstance(cols, str):
+        cols = [cols]
+    out = pd.Series("", index=df.index, dtype=object)
+    for col in reversed(list(cols)):
+        if col not in df:
+            continue
+        values = df[col]
+        present = values.notna() & values.astype(bool)
+        out = out.mask(present, values.astype(str))
+    return out
+
+def _split_rows(rows, values, n_rows: int) -> list:
+    """values, sorted by their rows, as one list per row 0..n_rows-1."""
+    bounds = np.searchsorted(rows, np.arange(n_rows + 1))
+    values = list(values)
+    return [values[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+def score_frame(df: pd.DataFrame, title_col="title", desc_col="description", matcher=None) -> pd.DataFrame:
+    """
+    Score a whole DataFrame of courses at once.
+
+    title_col / desc_col may be a column name or a sequence of names tried in
+    order (first non-empty value wins). Returns a DataFrame aligned to df.index
+    with relevance_score, matched_keywords, matched_groups (";"-joined) and
+    keyword_frequencies (JSON) columns, in the same form process_data writes.
+    """
+    matcher = matcher or load_matcher()
+    texts = (text_column(df, title_col) + " " + text_column(df, desc_col)).str.lower()
+
+    out = pd.DataFrame({
+        "relevance_score":     0.0,
+        "matched_keywords":    "",
+        "matched_groups":      "",
+        "keyword_frequencies": "{}",
+    }, index=df.index)
+    if matcher.trie is None or texts.empty:
+        return out
+
+    # (course, phrase) for every phrase present: the longest at each match
+    # position, then the shorter phrases sharing its start; one scan per text,
+    # courses matching nothing drop out here
+    texts = texts.reset_index(drop=True)
+    found = texts.str.findall(matcher.pattern).explode().dropna()
+    if found.empty:
+        return out
+    pairs = pd.DataFrame({"row": found.index, "phrase": found.to_numpy()}).drop_duplicates()
+    pairs["phrase"] = pairs["phrase"].map(lambda p: [p, *matcher.prefixes[p]])
+    pairs = pairs.explode("phrase").drop_duplicates().reset_index(drop=True)
+
+    # occurrences, one pass per phrase over the courses containing it; plain
+    # str.count on the object array (a fixed-width NumPy string array would pad
+    # every row to the longest text)
+    rows = pairs["row"].to_numpy()
+    texts_arr = texts.to_numpy()
+    counts = np.zeros(len(pairs), dtype=np.int64)
+    for phrase, idx in pairs.groupby("phrase").indices.items():
+        counts[idx] = [t.count(phrase) for t in texts_arr[rows[idx]]]
+
+    # per phrase: keywords containing it, their groups, first position in taxonomy order
+    index = {p: i for i, p in enumerate(matcher.phrases)}
+    mult = np.array([len(matcher.phrase_to_kws[p]) for p in matcher.phrases])
+    member = np.zeros((len(matcher.phrases), len(matcher.groups)), dtype=bool)
+    order = {}
+    for gi, _, parts in matcher.keywords:
+        for p in parts:
+            member[index[p], gi] = True
+            order.setdefault(p, len(order))
+
+    # groups hit, plus 0.5 per occurrence counted once per keyword containing the phrase
+    cols = pairs["phrase"].map(index).to_numpy()
+    freqs = counts * mult[cols]
+    hit = np.zeros((len(texts), len(matcher.groups)), dtype=bool)
+    np.logical_or.at(hit, rows, member[cols])
+    scores = hit @ np.asarray(matcher.weights, dtype=float) \
+        + 0.5 * np.bincount(rows, weights=freqs, minlength=len(texts))
+
+    # the ";"-joined / JSON columns, in score_text's order
+    kws = pd.DataFrame({"row": rows, "ki": pairs["phrase"].map(matcher.phrase_to_kws)}).explode("ki")
+    kws = kws.drop_duplicates().sort_values(["row", "ki"], kind="stable")
+    kws["kw"] = [matcher.keywords[ki][1] for ki in kws["ki"]]
+    kws = kws.drop_duplicates(["row", "kw"])
+    hit_rows, hit_groups = np.nonzero(hit)
+    ranked = np.lexsort((pairs["phrase"].map(order).to_numpy(), rows))
+    matched = [";".join(v) for v in _split_rows(kws["row"].to_numpy(), kws["kw"], len(texts))]
+    groups = [";".join(v) for v in _split_rows(hit_rows, np.asarray(matcher.groups)[hit_groups], len(texts))]
+    freq_json = [json.dumps(dict(zip(p, f)), ensure_ascii=False) for p, f in zip(
+        _split_rows(rows[ranked], pairs["phrase"].to_numpy()[ranked], len(texts)),
+        _split_rows(rows[ranked], freqs[ranked].tolist(), len(texts)))]
+
+    out["relevance_score"]     = scores
+    out["matched_keywords"]    = matched
+    out["matched_groups"]      = groups
+    out["keyword_frequencies"] = freq_json
+    return out
@@ -0,0 +1,14 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+config = PdfConfig(
+    name="alabama_a_m_pdf",
+    pdf="bamaAM.pdf",
+    sections=[
+        PdfSection(
+            layout="text",
+            collapse=True,
+            header=r"(?P<code>[A-Z]{2,4}\s*\d{3}[A-Z]?(?:/\s*[A-Z]{2,4}\s*\d{3}[A-Z]?)?)",
+            title=None,   # everything up to the next course ID
+        )
+    ]
+)
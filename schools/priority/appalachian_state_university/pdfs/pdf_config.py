@@ -0,0 +1,16 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+config = PdfConfig(
+    name="appalachian_state_university_pdf",
+    pdf="appst.pdf",
+    sections=[
+        PdfSection(
+            # "__ENG 2120" or "___BIO 1103", possibly several per line
+            header=r"_{2,3}\s*([A-Z&/]{2,5})\s*(\d{4})",
+            anywhere=True,
+            code=r"\1 \2",
+            title=None,   # the next 1-2 lines, if short
+            description=False,
+        )
+    ]
+)
@@ -0,0 +1,13 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+config = PdfConfig(
+    name="denmark_pdf",
+    pdf="denmark.pdf",
+    sections=[
+        PdfSection(
+            pages=(183, 202),
+            header=r"\b(?P<code>[A-Z]{3,4}\s\d{3})\s+(?P<title>[A-Za-z0-9 &/,\-:]+)",
+            desc_skip=r"\d+\s*CR",   # credit-hour lines like "3 CR"
+        )
+    ]
+)
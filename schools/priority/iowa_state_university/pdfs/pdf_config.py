@@ -0,0 +1,16 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+config = PdfConfig(
+    name="iowa_state_university_pdf",
+    pdf="iowast.pdf",
+    unique=True,
+    sections=[
+        PdfSection(
+            pages=(677, 1361),
+            header=r"\b([A-Z]{2,5})\s+(\d{3}[A-Z]?)[:\.]\s+(.+?)\s*$",
+            code=r"\1 \2",
+            title=r"\3",
+            description=False,
+        )
+    ]
+)
@@ -0,0 +1,15 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+config = PdfConfig(
+    name="morgan_state_university_pdf",
+    pdf="ucat_2016-2018.pdf",
+    backend="pdfplumber",
+    sections=[
+        PdfSection(
+            layout="text",
+            header=r"[A-Z]{3,4} \d{3} ",
+            # the description runs to the term it's offered, e.g. "(FALL/SPRING)"
+            record=r"(?P<code>[A-Z]{3,4} \d{3}) (?P<title>.+?)—.*?\n(?P<description>.*?\([A-Z/ ]+\))",
+        )
+    ]
+)
@@ -0,0 +1,28 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+CREDITS = r"(?i)\s*\d+\s+Credits?\s*$"
+
+config = PdfConfig(
+    name="pennsylvania_state_university_pdf",
+    pdf="undergraduate.pdf",
+    backend="pypdf2",
+    sections=[
+        # single-line courses: CODE TITLE CREDITS, no description
+        PdfSection(
+            pages=(3189, 3276),
+            header=r"([A-Z]{2,}\s\d+[A-Z]?)\s+(.+?)\s+(\d+)$",
+            code=r"\1",
+            title=r"\2",
+            description=False,
+        ),
+        # "CODE: TITLE", a credits line, then the description
+        PdfSection(
+            pages=(3301, 4773),
+            header=r"([A-Z]{2,}\s\d+[A-Z]?):\s+(.+)$",
+            code=r"\1",
+            title=r"\2",
+            desc_after=CREDITS,
+            desc_skip=CREDITS,
+        ),
+    ]
+)
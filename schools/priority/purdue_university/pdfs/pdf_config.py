@@ -0,0 +1,15 @@
+from report_tools.pdf_scraper import PdfConfig, PdfSection
+
+config = PdfConfig(
+    name="purdue_university_pdf",
+    pdf="2024-43-Courses.pdf",
+    backend="pdfplumber",
+    sections=[
+        PdfSection(
+            layout="text",
+            header=r"[A-Z]{3,4} \d{5} - ",
+            record=r"(?P<code>[A-Z]{3,4} \d{5}) - (?P<title>.+?)\n"
+                   r"Credit Hours: \d+\.\d+\. (?P<description>.+?)(?:Credits: \d+\.\d+)",
+        )
+    ]
+)
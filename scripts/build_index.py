@@ -0,0 +1,35 @@
+# scripts/build_index.py
+
+import sys
+from pathlib import Path
+
+# add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import argparse
+from report_tools.index import INDEX_DB, build_index, top_courses
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge every school's processed data into one SQLite course index."
+    )
+    parser.add_argument('--db', type=Path, default=INDEX_DB, help="Index file to create/update")
+    parser.add_argument('--force', action='store_true', help="Reindex every school, even if unchanged")
+    parser.add_argument('--top', metavar='GROUP', nargs='?', const='',
+                        help="After building, list top courses (optionally for one keyword group)")
+    parser.add_argument('--category', choices=('priority', 'non_priority'), help="Restrict --top to a category")
+    parser.add_argument('--limit', type=int, default=50, help="Rows to show with --top")
+    args = parser.parse_args()
+
+    conn = build_index(PROJECT_ROOT / "schools", args.db, force=args.force)
+
+    if args.top is not None:
+        rows = top_courses(conn, group=args.top or None, category=args.category, limit=args.limit)
+        print()
+        for category, school, title, score in rows:
+            print(f"{score:6.1f}  {category}/{school}  {title}")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,13 @@ def clear_raw(schools_root: Path):
             raw_dir = school / "raw_data"
             if not raw_dir.is_dir():
                 continue
-            for jf in raw_dir.glob("*.json"):
+            for jf in [*raw_dir.glob("*.json"), *raw_dir.glob("*.jsonl")]:
                 try:
                     jf.unlink()
                     deleted += 1
                 except Exception as e:
                     print(f"  ! error deleting {jf}: {e}")
-    print(f"✓ Deleted {deleted} raw JSON file(s).")
+    print(f"✓ Deleted {deleted} raw JSON/JSONL file(s).")
 
 def clear_visuals(schools_root: Path):
     deleted = 0
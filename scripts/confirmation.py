@@ -3,21 +3,25 @@
 import argparse
 import sys
 from pathlib import Path
-import json
 import re
 from collections import Counter
+from itertools import chain
 
 
 # add project root to sys.path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from report_tools.records import iter_records
+
 # TODO: ZACH
 
 # Should accept --school (and --mode all) so the Makefile can pass it through
 def load_json_courses(json_path):
-    with open(json_path, 'r', encoding='utf-8') as f:
-        json_data = json.load(f)
+    # one raw dump or several (e.g. a spider's and a PDF's JSONL); records are
+    # streamed (JSON array or JSON Lines) instead of parsing whole files
+    json_paths = [json_path] if isinstance(json_path, (str, Path)) else json_path
+    json_data = chain.from_iterable(iter_records(Path(p)) for p in json_paths)
 
     seen_descriptions = set()
     titles = set()
@@ -140,15 +144,19 @@ def process_school(school_arg: str):
     # accept either "priority/uni_name" or "non_priority/uni_name"
     school_dir = Path("schools") / school_arg
     json_file  = school_dir / "raw_data" / "combined.json"
+    json_files = [json_file]
+    if not json_file.exists():
+        # JSONL feeds (run_web_scrape.py --feed-format jsonl, PDF configs), all of them
+        json_files = sorted((school_dir / "raw_data").glob("*.jsonl"))
     txt_file   = school_dir / "formatted_courses.txt"
     report_file= school_dir / "comparison_report.txt"
 
-    if not json_file.exists():
+    if not json_files:
         raise FileNotFoundError(f"{json_file} not found")
     if not txt_file.exists():
         raise FileNotFoundError(f"{txt_file} not found")
 
-    report = compare_courses(json_file, txt_file)
+    report = compare_courses(json_files, txt_file)
     save_report(report, report_file)
 
 def process_all():
@@ -0,0 +1,28 @@
+# scripts/create_heatmap.py
+
+import sys
+from pathlib import Path
+
+# add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import argparse
+from report_tools.viz import heatmap
+
+OUTPUT_DIR = PROJECT_ROOT / "data" / "relational_output"
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the cross-school keyword-group heatmap.")
+    parser.add_argument('--out', type=Path, default=OUTPUT_DIR / "school_group_heatmap.html",
+                        help="Interactive HTML heatmap to write")
+    parser.add_argument('--matrix', type=Path, default=OUTPUT_DIR / "school_group_matrix.csv",
+                        help="Where to export the school x group count matrix")
+    args = parser.parse_args()
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.matrix.parent.mkdir(parents=True, exist_ok=True)
+    heatmap(PROJECT_ROOT / "schools", args.out, args.matrix)
+
+if __name__ == "__main__":
+    main()
@@ -7,72 +7,71 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 import argparse
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")  # files only; also safe in worker processes
+from matplotlib.figure import Figure
 from collections import Counter
-from report_tools.word_groups import load_keyword_groups
-
-def keyword_histogram(df: pd.DataFrame, out_png: Path, name: str):
+from report_tools.aggregates import load_aggregates
+from report_tools.fingerprints import code_version, load_manifest, sha256_json, write_manifest
+from report_tools.word_groups import EQUIV_FILE
+
+# per-school record of the inputs each figure was drawn from
+FIGURES_MANIFEST = ".figures.json"
+# redraw everything when the drawing code changes
+RENDER_CODE = code_version(Path(__file__).resolve())
+
+def _bar_chart(keys, vals, out_png: Path, title: str, fig_w: float, fig_h: float = 6, ymax=None):
+    # a standalone Figure (no pyplot state), so schools can render in parallel
+    fig = Figure(figsize=(fig_w, fig_h))
+    ax = fig.subplots()
+    ax.bar(keys, vals)
+    if ymax:
+        ax.set_ylim(0, ymax * 1.05)
+    for label in ax.get_xticklabels():
+        label.set_rotation(90)
+    ax.set_title(title)
+    fig.tight_layout()
+    fig.savefig(out_png)
+
+def keyword_histogram(counts: dict, out_png: Path, name: str, ymax=None):
     """
     Plot a histogram of raw keyword frequencies across all courses.
     """
-    freqs = df['keyword_frequencies'].dropna().apply(json.loads)
-    counter = Counter()
-    for d in freqs:
-        counter.update(d)
+    counter = Counter(counts)
     if not counter:
         return
     keywords, counts = zip(*counter.most_common())
-    
+
     n_bars = len(keywords)
     fig_w  = max(8, n_bars * 0.3)
-    fig_h = 6
-
-    plt.figure(figsize=(fig_w, fig_h))
-    plt.bar(keywords, counts)
-    plt.xticks(rotation=90)
-    plt.title(f"{name} — Keyword Frequency Histogram")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    _bar_chart(keywords, counts, out_png, f"{name} — Keyword Frequency Histogram", fig_w, ymax=ymax)
     return max(counts)
 
 
-def group_histogram(df: pd.DataFrame, out_png: Path, name: str):
+def group_histogram(counts: dict, out_png: Path, name: str, ymax=None):
     """
     Plot a histogram of matched keyword group occurrences.
     """
-    groups = df['matched_groups'].dropna().str.split(';').explode()
-    counts = groups.value_counts()
+    counts = pd.Series(counts, dtype=int).sort_values(ascending=False)
     if counts.empty:
         return
 
     # n_bars = len(groups)
     # fig_w  = max(8, n_bars * 0.3)
     fig_w  = 8
-    fig_h = 6
-
-    plt.figure(figsize=(fig_w, fig_h))
-    plt.bar(counts.index, counts.values)
-    plt.xticks(rotation=90)
-    plt.title(f"{name} — Keyword Group Histogram")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    _bar_chart(counts.index, counts.values, out_png, f"{name} — Keyword Group Histogram", fig_w, ymax=ymax)
     return int(counts.max())
 
-def collapsed_histogram(df: pd.DataFrame, out_png: Path, equiv_json: Path, name: str):
+def collapsed_histogram(counts: dict, out_png: Path, name: str, ymax=None):
     """
-    Collapse synonyms as per unique_word_groups.json and plot histogram.
+    Plot a histogram of keyword frequencies with synonyms collapsed
+    (as per unique_word_groups.json).
     """
-    mapping = json.loads(equiv_json.read_text(encoding='utf8'))
-    freqs = df['keyword_frequencies'].dropna().apply(json.loads)
-    counter = Counter()
-    for d in freqs:
-        for kw, cnt in d.items():
-            canon = next((master for master, group in mapping.items() if kw in group), kw)
-            counter[canon] += cnt
+    counter = Counter(counts)
     if not counter:
         return
     items = counter.most_common()
@@ -80,20 +79,12 @@ def collapsed_histogram(df: pd.DataFrame, out_png: Path, equiv_json: Path, name:
 
     n_bars = len(keys)
     fig_w  = max(8, n_bars * 0.3)
-    fig_h = 6
-
-    plt.figure(figsize=(fig_w, fig_h))
-    plt.bar(keys, vals)
-    plt.xticks(rotation=90)
-    plt.title(f"{name} — Collapsed Keyword Histogram")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    _bar_chart(keys, vals, out_png, f"{name} — Collapsed Keyword Histogram", fig_w, ymax=ymax)
     return max(vals)
 
 def compute_global_maxima(schools_root: Path, equiv_json: Path):
     """
-    Scan all schools to determine maximum y-axis values for each histogram type.
+    Scan all schools' aggregates to determine maximum y-axis values for each histogram type.
     """
     max_kw = max_grp = max_coll = 0
     for category in ("priority", "non_priority"):
@@ -101,115 +92,122 @@ def compute_global_maxima(schools_root: Path, equiv_json: Path):
         if not base.exists():
             continue
         for school in base.iterdir():
-            csv_path = school / "processed_data" / "processed.csv"
-            if not csv_path.exists():
+            agg = load_aggregates(school / "processed_data", equiv_json)
+            if agg is None:
                 continue
-            df = pd.read_csv(csv_path)
-            # keyword
-            freqs = df['keyword_frequencies'].dropna().apply(json.loads)
-            counter = Counter()
-            for d in freqs:
-                counter.update(d)
-            if counter:
-                max_kw = max(max_kw, max(counter.values()))
-            # group
-            groups = df['matched_groups'].dropna().str.split(';').explode()
-            counts = groups.value_counts()
-            if not counts.empty:
-                max_grp = max(max_grp, counts.max())
-            # collapsed
-            mapping = json.loads(equiv_json.read_text(encoding='utf8'))
-            counter2 = Counter()
-            for d in freqs:
-                for kw, cnt in d.items():
-                    canon = next((master for master, group in mapping.items() if kw in group), kw)
-                    counter2[canon] += cnt
-            if counter2:
-                max_coll = max(max_coll, max(counter2.values()))
+            max_kw   = max(max_kw, agg["maxima"]["keywords"])
+            max_grp  = max(max_grp, agg["maxima"]["groups"])
+            max_coll = max(max_coll, agg["maxima"]["collapsed"])
     return max_kw, max_grp, max_coll
 
+# (file name, aggregates key, drawing function)
+FIGURES = (
+    ("keyword_freq.png",   "keywords",  keyword_histogram),
+    ("group_freq.png",     "groups",    group_histogram),
+    ("collapsed_freq.png", "collapsed", collapsed_histogram),
+)
+
+def figure_digest(counts: dict, name: str, ymax) -> str:
+    """Digest of everything a figure depends on: its counts (in order), labels, axis scale and this script."""
+    return sha256_json({
+        "counts": list(counts.items()),
+        "name": name,
+        "ymax": ymax,
+        "code": RENDER_CODE,
+    })
+
+def render_school(school: Path, mode: str, equiv_json: Path = EQUIV_FILE, ymax: dict = None):
+    """
+    Draw one school's three histograms. 'update' redraws only figures whose
+    inputs (see figure_digest) changed. ymax optionally fixes each kind's y-axis.
+    Returns (maxima, status line), or None if the school has no processed data.
+    """
+    agg = load_aggregates(school / "processed_data", equiv_json)
+    if agg is None:
+        # print(f"  ! Missing processed data for {school.name}")
+        return None
+
+    fig_dir = school / "figures"
+    if not fig_dir.exists():
+        raise FileNotFoundError(f"Missing figures directory: {fig_dir}")
+
+    manifest_path = fig_dir / FIGURES_MANIFEST
+    drawn = load_manifest(manifest_path)
+    redrawn = 0
+    for file_name, key, histogram in FIGURES:
+        out_png = fig_dir / file_name
+        scale = (ymax or {}).get(key)
+        digest = figure_digest(agg[key], school.name, scale)
+        if mode == 'add' and out_png.exists():
+            continue
+        if mode == 'update' and out_png.exists() and drawn.get(file_name) == digest:
+            continue
+        if histogram(agg[key], out_png, school.name, scale) is not None:
+            redrawn += 1
+        drawn[file_name] = digest
+    write_manifest(manifest_path, drawn)
+
+    if mode == 'add' and any((fig_dir / f).exists() for f, _, _ in FIGURES):
+        return agg["maxima"], f"SKIP: {school.name} (mode={mode})"
+    if mode == 'update' and not redrawn:
+        return agg["maxima"], f"SKIP: {school.name} (mode={mode}, unchanged)"
+    return agg["maxima"], f"Saved visuals for {school.name} (mode={mode})"
+
 def main():
     parser = argparse.ArgumentParser(description="Generate course keyword visuals.")
     parser.add_argument(
-        '--mode', choices=['add', 'replace'], default='add',
-        help="'add': skip existing figures; 'replace': regenerate all"
+        '--mode', choices=['update', 'add', 'replace'], default='update',
+        help="'update': redraw figures whose inputs changed; 'add': skip existing figures; 'replace': regenerate all"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="Processes to render schools in (1 = serial, 0 = one per CPU)"
+    )
+    parser.add_argument(
+        '--shared-axes', action='store_true',
+        help="Scale each histogram kind's y-axis to the maximum across all schools"
     )
     args = parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
 
     root = Path(__file__).resolve().parent.parent / "schools"
-    equiv_json = Path(__file__).resolve().parent.parent / "data/word_groups/unique_word_groups.json"
+    equiv_json = EQUIV_FILE
+
+    schools = []
+    for category in ("priority", "non_priority"):
+        cat_dir = root / category
+        if not cat_dir.exists():
+            continue
+        schools += list(cat_dir.iterdir())
 
     # track per-school maxima
     kw_max_by_school   = {}
     grp_max_by_school  = {}
     coll_max_by_school = {}
 
-    for category in ("priority", "non_priority"):
-        cat_dir = root / category
-        if not cat_dir.exists():
-            continue
-        for school in cat_dir.iterdir():
-            skip_flag = False
-            # print(f"Processing {school.name}...")
-            proc_csv = school / "processed_data" / "processed.csv"
-            if not proc_csv.exists():
-                # print(f"  ! Missing processed CSV: {proc_csv}")
-                skip_flag = True
-                continue
-            if skip_flag:
-                raise Exception("CONTINUE NOT WORKING")
-            df = pd.read_csv(proc_csv)
-
-            fig_dir = school / "figures"
-            if not fig_dir.exists():
-                raise FileNotFoundError(f"Missing figures directory: {fig_dir}")
-
-            # raw keyword histogram
-            out_kw = fig_dir / "keyword_freq.png"
-            if args.mode=='replace' or not out_kw.exists():
-                kw_max = keyword_histogram(df, out_kw, school.name)
-            else:
-                # if skipping, still compute counts
-                freqs = df['keyword_frequencies'].dropna().apply(json.loads)
-                counter = Counter(); [counter.update(d) for d in freqs]
-                kw_max = max(counter.values()) if counter else 0
-            kw_max_by_school[school.name] = kw_max
-
-            # group histogram
-            out_grp = fig_dir / "group_freq.png"
-            if args.mode=='replace' or not out_grp.exists():
-                grp_max = group_histogram(df, out_grp, school.name)
-            else:
-                groups = df['matched_groups'].dropna().str.split(';').explode()
-                counts = groups.value_counts()
-                grp_max = int(counts.max()) if not counts.empty else 0
-            grp_max_by_school[school.name] = grp_max
-
-            # collapsed histogram
-            out_coll = fig_dir / "collapsed_freq.png"
-            if args.mode=='replace' or not out_coll.exists():
-                coll_max = collapsed_histogram(df, out_coll, equiv_json, school.name)
-            else:
-                mapping = json.loads(equiv_json.read_text(encoding='utf8'))
-                freqs = df['keyword_frequencies'].dropna().apply(json.loads)
-                counter = Counter()
-                for d in freqs:
-                    for kw, cnt in d.items():
-                        canon = next((m for m, grp in mapping.items() if kw in grp), kw)
-                        counter[canon] += cnt
-                coll_max = max(counter.values()) if counter else 0
-            coll_max_by_school[school.name] = coll_max
-
-            if args.mode == 'replace':
-                print(f"Saved visuals for {school.name} (mode={args.mode})")
-            else:
-                # check if any of the files exist
-                if out_kw.exists() or out_grp.exists() or out_coll.exists():
-                    print(f"SKIP: {school.name} (mode={args.mode})")
-                    continue
-                else:
-                    print(f"Saved visuals for {school.name} (mode={args.mode})")
-    
+    def collect(school, result):
+        if result is None:
+            return
+        maxima, status = result
+        kw_max_by_school[school.name]   = maxima["keywords"]
+        grp_max_by_school[school.name]  = maxima["groups"]
+        coll_max_by_school[school.name] = maxima["collapsed"]
+        print(status)
+
+    ymax = None
+    if args.shared_axes:
+        ymax = dict(zip(("keywords", "groups", "collapsed"), compute_global_maxima(root, equiv_json)))
+
+    render = partial(render_school, mode=args.mode, equiv_json=equiv_json, ymax=ymax)
+    if workers > 1 and len(schools) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order, so output and tie-breaks stay deterministic
+            for school, result in zip(schools, pool.map(render, schools)):
+                collect(school, result)
+    else:
+        for school in schools:
+            collect(school, render(school))
+
     # --- summary ---
     # print("creating summary")
     def top(d):
@@ -228,4 +226,4 @@ def main():
     print(f"Highest collapsed-keyword count: {coll_val}  ({coll_school})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,7 +1,14 @@
 # scripts/process_data.py
 
 import sys
+import io
+import os
 import json
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache, partial
 from pathlib import Path
 import re
 
@@ -10,50 +17,68 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 import pandas as pd
-from report_tools.word_groups import calculate_score_and_matches
+from report_tools.word_groups import KEYWORD_FILE, load_matcher, score_frame
+from report_tools.records import NotAListError, chunked, iter_records
+from report_tools.processed import PROCESSED_CSV, PROCESSED_PARQUET, parquet_available, write_parquet
+from report_tools.rescore import PHRASE_COUNTS, phrase_count_entries, save_phrase_counts
+from report_tools.aggregates import build_aggregates, count_rows, write_aggregates
+from report_tools.fingerprints import (
+    FINGERPRINT_FILE, code_version, file_digests, load_manifest,
+    same_inputs, sha256_file, write_manifest,
+)
 
-def process_school(school_dir: Path):
-    raw_dir = school_dir / "raw_data"
-    out_dir = school_dir / "processed_data"
-    out_dir.mkdir(parents=True, exist_ok=True)
+# anything that changes what process_school writes
+SCORING_CODE = (
+    *(PROJECT_ROOT / "report_tools" / name for name in
+      ("word_groups.py", "records.py", "processed.py", "rescore.py", "aggregates.py", "fingerprints.py")),
+    Path(__file__).resolve(),
+)
+FINGERPRINT_KEYS = ("raw", "keywords", "code", "parquet")
+
+RAW_PATTERNS = ("*.json", "*.jsonl")
+CHUNK_SIZE = 5000   # records scored per DataFrame; bounds memory per school
+
+@lru_cache(maxsize=None)
+def _shared_fingerprint() -> dict:
+    # same for every school in a run, so hash once
+    return {"keywords": sha256_file(KEYWORD_FILE), "code": code_version(*SCORING_CODE)}
 
-    # gather every JSON under raw_data
-    items = []
-    for raw_file in raw_dir.glob("*.json"):
+def school_fingerprint(raw_files, previous: dict, parquet: bool) -> dict:
+    return {"raw": file_digests(raw_files, previous.get("raw")), "parquet": parquet, **_shared_fingerprint()}
+
+def iter_raw_records(raw_files):
+    """Yield course records from every raw dump, warning on (and skipping past) bad files."""
+    for raw_file in raw_files:
+        n = 0
         try:
-            data = json.loads(raw_file.read_text(encoding="utf8"))
-            if isinstance(data, list):
-                items.extend(data)
-            else:
-                print(f"   • warning: {raw_file.name} not a list, skipping")
+            for record in iter_records(raw_file):
+                if isinstance(record, dict):
+                    n += 1
+                    yield record
+        except NotAListError:
+            print(f"   • warning: {raw_file.name} not a list, skipping")
         except json.JSONDecodeError:
-            print(f"   • warning: could not parse {raw_file.name}, skipping")
+            if n:
+                print(f"   • warning: could not parse {raw_file.name} past record {n}, keeping the first {n}")
+            else:
+                print(f"   • warning: could not parse {raw_file.name}, skipping")
 
-    if not items:
-        # remove stale CSV if exists
-        # print(f" → no raw items for {school_dir.name}, skipping without touch")
-        return
+def score_chunk(records) -> pd.DataFrame:
+    """Score, filter and clean one chunk of raw records."""
+    df = pd.DataFrame(records)
+    scores = score_frame(df,
+                         title_col=("course title", "title"),
+                         desc_col=("course description", "description"))
+    for col in scores.columns:
+        df[col] = scores[col]
+    # keep the per-item column order: first record's fields, then scores, then the rest
+    df = df[list(dict.fromkeys([*records[0], *scores.columns, *df.columns]))]
+
+    # normalise column names, later duplicates win (as per-item dict update did)
+    df.columns = [str(k).strip().lower().replace(" ", "_") for k in df.columns]
+    df = df.loc[:, ~df.columns.duplicated(keep="last")]
 
-    # Score & augment each item
-    rows = []
-    for item in items:
-        title = item.get("course title") or item.get("title") or ""
-        desc  = item.get("course description") or item.get("description") or ""
-        score, kws, groups, freqs = calculate_score_and_matches(title, desc)
-        item.update({
-            "relevance_score":     score,
-            "matched_keywords":    ";".join(kws),
-            "matched_groups":      ";".join(groups),
-            "keyword_frequencies": json.dumps(freqs, ensure_ascii=False)
-        })
-        cleaned = {}
-        for k, v in item.items():
-            key = k.strip().lower().replace(" ", "_")
-            cleaned[key] = v
-        rows.append(cleaned)
-    
-    # Build DataFrame and filter
-    df = pd.DataFrame(rows)
+    # filter
     df = df[df["relevance_score"] > 0]
 
     for col in df.select_dtypes(include="object"):
@@ -61,16 +86,110 @@ def process_school(school_dir: Path):
             .fillna("")
             .map(lambda s: re.sub(r'\s{2,}', ' ', re.sub(r'[\n\r\t]{1,}', ' ', s)) if not (isinstance(s, float) or isinstance(s, list) or isinstance(s, dict)) else s)
         )
+    return df
 
-    out_csv = out_dir / "processed.csv"
-    if df.empty:
+def merge_kinds(kinds: dict, df: pd.DataFrame, seen_before: int) -> list:
+    """
+    Fold one chunk's column dtypes into kinds (column -> "int", "float" or
+    "other") the way a single DataFrame over every record so far would infer
+    them: an int column turns float once any record has a float or lacks it.
+    Returns the columns that just turned float (rows already written as ints
+    must be rewritten).
+    """
+    widened = []
+    for col in [*kinds, *(c for c in df.columns if c not in kinds)]:
+        if col not in df.columns:
+            kind = "float"   # no record in this chunk has it
+        elif pd.api.types.is_integer_dtype(df[col].dtype):
+            kind = "int" if col in kinds or not seen_before else "float"
+        elif pd.api.types.is_float_dtype(df[col].dtype):
+            kind = "float"
+        else:
+            kind = "other"
+        old = kinds.get(col, kind)
+        new = "other" if "other" in (old, kind) else "float" if "float" in (old, kind) else "int"
+        if old == "int" and new == "float":
+            widened.append(col)
+        kinds[col] = new
+    return widened
+
+def process_school(school_dir: Path, force: bool = False, parquet: bool = False):
+    raw_dir = school_dir / "raw_data"
+    out_dir = school_dir / "processed_data"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_csv = out_dir / PROCESSED_CSV
+    out_parquet = out_dir / PROCESSED_PARQUET
+    out_counts = out_dir / PHRASE_COUNTS
+
+    # skip schools whose raw inputs, taxonomy and scoring code are unchanged
+    raw_files = [f for pattern in RAW_PATTERNS for f in raw_dir.glob(pattern)]
+    if not raw_files:
+        return
+    manifest_path = out_dir / FINGERPRINT_FILE
+    previous = load_manifest(manifest_path)
+    fingerprint = school_fingerprint(raw_files, previous, parquet)
+    output_ok = (out_csv.exists() and out_counts.exists() and (out_parquet.exists() or not parquet)) \
+        or previous.get("rows") == 0
+    if not force and output_ok and same_inputs(previous, fingerprint, FINGERPRINT_KEYS):
+        print(f" → {school_dir.name} unchanged, skipping")
+        return
+
+    # stream records, scoring and appending relevant rows chunk by chunk
+    tmp_csv = out_csv.with_name(out_csv.name + ".tmp")
+    tmp_csv.unlink(missing_ok=True)
+    columns = []   # output column order; grows if later records add fields
+    kinds = {}     # inferred column kinds across chunks; ints widen to floats
+    seen = written = 0
+    counts = ([], [], [])   # sparse course x phrase occurrences, for what-if rescoring
+    keyword_totals, group_totals = Counter(), Counter()   # visuals aggregates
+    for chunk in chunked(iter_raw_records(raw_files), CHUNK_SIZE):
+        df = score_chunk(chunk)
+        # dtypes come from the whole chunk, filtered-out records included
+        widened = [c for c in merge_kinds(kinds, df, seen) if c in columns]
+        seen += len(chunk)
+        if df.empty:
+            continue
+        new_cols = [c for c in df.columns if c not in columns]
+        columns += new_cols
+        if (new_cols or widened) and written:
+            # widen the rows already written (only relevant rows, so this stays small)
+            done = pd.read_csv(tmp_csv, dtype=str, keep_default_na=False)
+            for col in widened:
+                done[col] = pd.to_numeric(done[col].replace("", None)).astype(float)
+            done.reindex(columns=columns).to_csv(tmp_csv, index=False)
+        floats = [c for c in df.columns if kinds[c] == "float" and pd.api.types.is_integer_dtype(df[c].dtype)]
+        df = df.astype({c: float for c in floats})
+        df.reindex(columns=columns).to_csv(tmp_csv, mode="a", header=not written, index=False)
+        freqs = df["keyword_frequencies"].map(json.loads)
+        count_rows(freqs, df["matched_groups"].map(lambda s: s.split(";") if s else []),
+                   keyword_totals, group_totals)
+        entries = phrase_count_entries(freqs, load_matcher(), written)
+        for acc, part in zip(counts, entries):
+            acc += part
+        written += len(df)
+
+    if not seen:
+        # remove stale CSV if exists
+        # print(f" → no raw items for {school_dir.name}, skipping without touch")
+        return
+
+    if not written:
         print(f" → filtered out everything for {school_dir.name} (no relevant rows), keeping old {out_csv.name} if any")
     else:
-        df.to_csv(out_csv, index=False)
-        print(f" → Wrote {len(df)} relevant records to {out_csv}")
+        os.replace(tmp_csv, out_csv)
+        save_phrase_counts(out_counts, *counts, load_matcher().phrases, written)
+        print(f" → Wrote {written} relevant records to {out_csv}")
+        if parquet:
+            # relevant rows only, so re-reading the CSV is cheap
+            write_parquet(pd.read_csv(out_csv), out_parquet)
+        else:
+            # readers prefer parquet, so never leave one behind that's older than the CSV
+            out_parquet.unlink(missing_ok=True)
+        write_aggregates(out_dir, build_aggregates(keyword_totals, group_totals))
+    write_manifest(manifest_path, {**fingerprint, "rows": written})
 
-def main():
-    print("Processing raw data into processed_data/processed.csv")
+def discover_schools():
+    schools = []
     for category in ("priority", "non_priority"):
         base = PROJECT_ROOT / "schools" / category
         if not base.exists(): 
@@ -78,8 +197,50 @@ def main():
         for school in sorted(base.iterdir()):
             if not school.is_dir():
                 continue
-            # print(f"Processing {category}/{school.name} …")
-            process_school(school)
+            schools.append(school)
+    return schools
+
+def _init_worker():
+    # compile the keyword matcher once per worker process
+    load_matcher()
+
+def _process_school_captured(school_dir: Path, force: bool = False, parquet: bool = False) -> str:
+    """Run process_school in a worker, returning its output for ordered printing."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        process_school(school_dir, force, parquet)
+    return buf.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Score raw_data into processed_data for every school.")
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="Processes to fan schools out over (1 = serial, 0 = one per CPU)"
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help="Rescore every school even if its fingerprint is unchanged"
+    )
+    parser.add_argument(
+        '--parquet', action='store_true',
+        help="Also write processed.parquet (typed columns; preferred by downstream readers)"
+    )
+    args = parser.parse_args()
+    if args.parquet and not parquet_available():
+        parser.error("--parquet needs pyarrow (pip install pyarrow)")
+    workers = args.workers or os.cpu_count() or 1
+
+    print("Processing raw data into processed_data/processed.csv")
+    schools = discover_schools()
+    if workers > 1 and len(schools) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            # map() yields in submission order, so output stays deterministic
+            for output in pool.map(partial(_process_school_captured, force=args.force, parquet=args.parquet), schools):
+                print(output, end="")
+    else:
+        for school in schools:
+            # print(f"Processing {school.parent.name}/{school.name} …")
+            process_school(school, args.force, args.parquet)
 
 if __name__ == "__main__":
     main()
@@ -7,29 +7,36 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import json
-import pandas as pd
-from pathlib import Path
+import argparse
 from report_tools.tables import create_relational_tables
+from report_tools.processed import load_processed, parquet_available
+from report_tools.warehouse import WAREHOUSE_DIR, build_warehouse
 
 def process_school_relations(school_dir: Path):
-    proc_json = school_dir / "processed_data" / "processed.json"
-    if not proc_json.exists():
-        print(f"  – skipping {school_dir.name}: no processed.json")
+    # parquet, CSV or legacy processed.json, whichever the school has
+    df = load_processed(school_dir / "processed_data", typed=False)
+    if df is None:
+        print(f"  – skipping {school_dir.name}: no processed data")
         return
-    # load JSON into a DataFrame
-    df = pd.read_json(proc_json, orient="records")
-    # write out a temporary CSV
-    csv_path = school_dir / "processed_data" / "processed_temp.csv"
-    df.to_csv(csv_path, index=False)
     # create a relations/ subdir
     rel_dir = school_dir / "processed_data" / "relations"
-    create_relational_tables(csv_path, rel_dir)
-    csv_path.unlink()  # clean up
+    create_relational_tables(df, rel_dir)
     print(f"  ✔ relational tables for {school_dir.name} in {rel_dir}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Build relational tables from processed_data.")
+    parser.add_argument('--warehouse', action='store_true',
+                        help=f"Write one cross-school parquet dataset (to {WAREHOUSE_DIR.relative_to(PROJECT_ROOT)}) "
+                             "instead of per-school relations/ folders")
+    parser.add_argument('--force', action='store_true', help="With --warehouse, rewrite every school")
+    args = parser.parse_args()
+
     root = Path(__file__).resolve().parent.parent / "schools"
+    if args.warehouse:
+        if not parquet_available():
+            parser.error("--warehouse needs pyarrow (pip install pyarrow)")
+        build_warehouse(root, force=args.force)
+        return
     for category in ("priority","non_priority"):
         cat_dir = root / category
         if not cat_dir.exists(): continue
@@ -0,0 +1,102 @@
+# scripts/rescore.py
+
+import sys
+from pathlib import Path
+
+# add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import argparse
+import json
+import pandas as pd
+from report_tools.index import TITLE_COLUMNS
+from report_tools.processed import FREQ_COLUMN, load_processed
+from report_tools.rescore import PHRASE_COUNTS, load_phrase_counts, phrase_counts_from_frequencies, rescore
+from report_tools.word_groups import KEYWORD_FILE, load_matcher, text_column
+
+def parse_weight(value: str):
+    group, sep, weight = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected GROUP=WEIGHT, got {value!r}")
+    return group, float(weight)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rescore processed courses under a candidate taxonomy using the cached "
+                    "phrase counts, or the processed keyword frequencies (no raw data is re-read)."
+    )
+    parser.add_argument('--keywords', type=Path, default=KEYWORD_FILE,
+                        help="Keyword groups JSON to try (default: the current taxonomy)")
+    parser.add_argument('--weight', type=parse_weight, action='append', default=[], metavar='GROUP=WEIGHT',
+                        help="Override a group's weight (repeatable; GROUP with or without its -N suffix)")
+    parser.add_argument('--category', choices=('priority', 'non_priority'), help="Only rescore one category")
+    parser.add_argument('--top', type=int, default=10, help="Top rescored courses to list")
+    parser.add_argument('--out', type=Path, help="Write every rescored course to this CSV")
+    args = parser.parse_args()
+
+    with open(args.keywords, "r", encoding="utf8") as f:
+        keyword_groups = json.load(f)
+    weights = dict(args.weight)
+
+    frames = []
+    warned = False
+    categories = [args.category] if args.category else ["priority", "non_priority"]
+    for category in categories:
+        cat_dir = PROJECT_ROOT / "schools" / category
+        if not cat_dir.is_dir():
+            continue
+        for school in sorted(cat_dir.iterdir()):
+            proc_dir = school / "processed_data"
+            df = load_processed(proc_dir)
+            if df is None:
+                continue
+            cache = None
+            if (proc_dir / PHRASE_COUNTS).exists():
+                cache = load_phrase_counts(proc_dir / PHRASE_COUNTS)
+                if int(cache["n_rows"]) != len(df):
+                    print(f"   • warning: {category}/{school.name}: phrase cache out of date, "
+                          f"using keyword_frequencies")
+                    cache = None
+            if cache is None:
+                # no cache (e.g. raw_data already cleared): derive it from the processed rows
+                cache = phrase_counts_from_frequencies(df[FREQ_COLUMN], load_matcher())
+            scores, _, _, missing = rescore(cache, keyword_groups, weights)
+            if missing and not warned:
+                warned = True
+                print(f"   • warning: {len(missing)} taxonomy phrase(s) were never counted "
+                      f"(e.g. {missing[0]!r}); run process-data to score them")
+
+            frames.append(pd.DataFrame({
+                "category": category,
+                "school": school.name,
+                "title": text_column(df, TITLE_COLUMNS),
+                "old_score": df["relevance_score"].astype(float),
+                "new_score": scores,
+            }))
+
+    if not frames:
+        print("No processed data found; run process-data first.")
+        return
+    result = pd.concat(frames, ignore_index=True)
+
+    summary = result.groupby(["category", "school"]).agg(
+        old_relevant=("old_score", lambda s: int((s > 0).sum())),
+        new_relevant=("new_score", lambda s: int((s > 0).sum())),
+        old_mean=("old_score", "mean"),
+        new_mean=("new_score", "mean"),
+    )
+    print(summary.round(2).to_string())
+    print(f"\nRelevant courses: {int((result['old_score'] > 0).sum())} → {int((result['new_score'] > 0).sum())}")
+
+    if args.top:
+        print()
+        for row in result.nlargest(args.top, "new_score").itertuples():
+            print(f"{row.new_score:6.1f} (was {row.old_score:5.1f})  {row.category}/{row.school}  {row.title}")
+
+    if args.out:
+        result.to_csv(args.out, index=False)
+        print(f"\nWrote rescored courses → {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -2,29 +2,47 @@
 
 """
 Script to run per‑school PDF scrapers as defined in each school's `pdf/` folder.
-Assumptions:
+Schools with a `pdfs/pdf_config.py` (`config = PdfConfig(...)`) are parsed in this
+process by report_tools.pdf_scraper, all sharing one page-extraction pool, into
+raw_data/<config name>.jsonl. For the rest:
   - If no .py files found in pdf/, skip.
   - If exactly one .py file, run it from inside the pdf/ directory.
   - If more than one .py file, report an error and skip.
-  - After running, check for creation of any .json, .csv, or .txt files as proof of success.
+  - After running, check for creation of any .json, .jsonl, .csv, or .txt files as proof of success.
+With --jobs N, up to N schools run at once, each in its own process with a
+timeout, its stdout / stderr logged under data/logs/pdf_scrape/.
 Usage:
   make pdf-scrape
   make pdf-scrape-all
 
   or
 
-  python scripts/run_pdf_scrape.py --mode <missing|all>
+  python scripts/run_pdf_scrape.py --mode <missing|all> [--workers N] [--jobs N [--timeout SECONDS]]
 """
 
 import argparse
+import os
+import signal
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from report_tools.fingerprints import FINGERPRINT_FILE, load_manifest
+from report_tools.pdf_scraper import PDF_CONFIG, load_pdf_config, scrape_school
+
+# per-school stdout / stderr of --jobs runs: <category>/<school>.stdout.log / .stderr.log
+LOG_DIR = PROJECT_ROOT / "data" / "logs" / "pdf_scrape"
+
 def run_pdf_scraper(pdf_dir: Path) -> bool:
     """
     Locate and run the single PDF scraper in pdf_dir.
-    Returns True if scraper ran and emitted at least one output file (.json/.csv/.txt), else False.
+    Returns True if scraper ran and emitted at least one output file (.json/.jsonl/.csv/.txt), else False.
     """
     # find python scripts
     py_files = list(pdf_dir.glob("*.py"))
@@ -42,24 +60,31 @@ def run_pdf_scraper(pdf_dir: Path) -> bool:
         return False
     # check outputs
     outputs = []
-    for ext in ("*.json", "*.csv", "*.txt"):
+    for ext in ("*.json", "*.jsonl", "*.csv", "*.txt"):
         outputs.extend(pdf_dir.glob(ext))
     if not outputs:
-        print(f"  ! No output files (.json/.csv/.txt) in {pdf_dir} after running scraper")
+        print(f"  ! No output files (.json/.jsonl/.csv/.txt) in {pdf_dir} after running scraper")
         return False
     print(f"  ✓ Output files: {[p.name for p in outputs]}")
     return True
 
-def main():
-    parser = argparse.ArgumentParser(description="Run school PDF scrapers.")
-    parser.add_argument('--mode', choices=['missing','all'], required=True,
-                        help="'missing': only schools without processed_data; 'all': every school")
-    args = parser.parse_args()
-
-    project_root = Path(__file__).resolve().parents[1]
-    schools_root = project_root / 'schools'
+def run_pdf_config(school_dir: Path, config, workers: int, pool) -> bool:
+    """Parse the school's PDF with the shared engine; True if any courses came out."""
+    print(f"  → Parsing {config.pdf} ({config.name})")
+    try:
+        n = scrape_school(school_dir, config, workers, pool)
+    except Exception as e:
+        print(f"  ! {config.name}: {e}")
+        return False
+    if not n:
+        print(f"  ! No courses found in {config.pdf}")
+        return False
+    print(f"  ✓ {n} courses → raw_data/{config.name}.jsonl")
+    return True
 
-    failures = []
+def select_schools(schools_root: Path, mode: str, only: str = None):
+    """(category, school dir, config or None) for each school to scrape, in order."""
+    selected = []
     for category in ('priority', 'non_priority'):
         cat_dir = schools_root / category
         if not cat_dir.is_dir():
@@ -67,14 +92,24 @@ def main():
         for school in sorted(cat_dir.iterdir()):
             if not school.is_dir():
                 continue
+            if only and f"{category}/{school.name}" != only:
+                continue
 
             pdf_dir = school / 'pdfs'
+            config = load_pdf_config(pdf_dir / PDF_CONFIG) if (pdf_dir / PDF_CONFIG).exists() else None
 
             existing_outputs = []
-            for ext in ("*.json", "*.csv", "*.txt"):
+            for ext in ("*.json", "*.jsonl", "*.csv", "*.txt"):
                 existing_outputs.extend(pdf_dir.glob(ext))
-
-            if args.mode == 'missing' and existing_outputs:
+            if config:
+                # clear-raw deletes the JSONL once processed; the processed
+                # fingerprint still lists it
+                raw_file = f"{config.name}.jsonl"
+                processed = load_manifest(school / 'processed_data' / FINGERPRINT_FILE).get('raw', {})
+                if (school / 'raw_data' / raw_file).exists() or raw_file in processed:
+                    existing_outputs.append(raw_file)
+
+            if mode == 'missing' and existing_outputs:
                 print(f"Skipping {category}/{school.name} (already has PDF outputs).")
                 continue
 
@@ -82,9 +117,84 @@ def main():
                 print(f"No pdf/ folder for {school.name}, skipping.")
                 continue
 
-            ok = run_pdf_scraper(pdf_dir)
+            selected.append((category, school, config))
+    return selected
+
+def run_job(category: str, school: Path, args) -> tuple:
+    """
+    Scrape one school in a child process (this script, --school), its stdout /
+    stderr going to log files. Returns (school key, status, seconds, log base).
+    """
+    key = f"{category}/{school.name}"
+    log_base = LOG_DIR / category / school.name
+    log_base.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--mode', 'all',
+           '--school', key, '--workers', str(args.workers)]
+    start = time.perf_counter()
+    with open(f"{log_base}.stdout.log", 'w') as out, open(f"{log_base}.stderr.log", 'w') as err:
+        # own session, so a timeout takes down the extraction pool / scraper script too
+        proc = subprocess.Popen(cmd, stdout=out, stderr=err, start_new_session=True,
+                                env={**os.environ, 'PYTHONUNBUFFERED': '1'})
+        try:
+            code = proc.wait(timeout=args.timeout)
+            status = "ok" if code == 0 else f"failed (exit {code})"
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+            status = f"timed out after {args.timeout}s"
+    return key, status, time.perf_counter() - start, log_base
+
+def run_jobs(selected, args) -> list:
+    """Scrape the selected schools --jobs at a time; prints each as it ends, returns the failures."""
+    # schools with nothing to run would only cost a process start each
+    selected = [(c, s, cfg) for c, s, cfg in selected if cfg or any((s / 'pdfs').glob('*.py'))]
+    print(f"Scraping {len(selected)} school(s), {args.jobs} at a time; logs in {LOG_DIR}")
+    failures = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(run_job, category, school, args) for category, school, _ in selected]
+        for future in as_completed(futures):
+            key, status, seconds, log_base = future.result()
+            print(f"  {'✓' if status == 'ok' else '!'} {key}: {status} ({seconds:.1f}s)")
+            if status != 'ok':
+                failures.append(f"{key}: {status}, see {log_base}.stdout.log / .stderr.log")
+    return sorted(failures)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run school PDF scrapers.")
+    parser.add_argument('--mode', choices=['missing','all'], required=True,
+                        help="'missing': only schools without processed_data; 'all': every school")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes extracting PDF pages, shared by every configured school "
+                             "(0 = one per CPU)")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="Schools scraped at once, each in its own process with its output "
+                             "logged under data/logs/pdf_scrape/ (1 = one after another, in this process)")
+    parser.add_argument('--timeout', type=int, default=3600,
+                        help="With --jobs > 1, seconds before a school's scraper is killed")
+    parser.add_argument('--school', metavar='CATEGORY/SCHOOL',
+                        help="Only this school, e.g. priority/denmark_technical_college")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[1]
+    schools_root = project_root / 'schools'
+    selected = select_schools(schools_root, args.mode, args.school)
+
+    if args.jobs > 1:
+        failures = run_jobs(selected, args)
+    else:
+        workers = args.workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        failures = []
+        for category, school, config in selected:
+            if config:
+                print(f"{category}/{school.name}:")
+                ok = run_pdf_config(school, config, workers, pool)
+            else:
+                ok = run_pdf_scraper(school / 'pdfs')
             if not ok:
                 failures.append(f"{category}/{school.name}")
+        if pool:
+            pool.shutdown()
 
     if failures:
         print("\nPDF scraping failed for the following schools:")
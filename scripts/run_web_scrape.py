@@ -10,12 +10,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 import argparse
 import importlib.util
+import tempfile
 from pathlib import Path
 
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
 
 from scraper_module.scraper_lib.scraper_engine import ScraperEngine
+from report_tools.crawl import CrawlScheduler, spider_settings
+from report_tools.httpcache import CACHE_MODES, HTTP_CACHE_DIR, cache_settings
 
 def discover_config_files(schools_root: Path):
     """
@@ -36,7 +39,8 @@ def needs_run(school_dir: Path) -> bool:
     if not pd.exists():
         return True
     # consider "processed" if there's any file in processed_data
-    files = [f for f in pd.iterdir() if (f.is_file() and f.name != '.gitignore')]
+    # (dotfiles such as .gitignore and the fingerprint manifest don't count)
+    files = [f for f in pd.iterdir() if (f.is_file() and not f.name.startswith('.'))]
     return len(files) == 0
 
 def load_config_module(path: Path):
@@ -54,6 +58,21 @@ def main():
         '--mode', choices=('missing', 'all'), default='missing',
         help="Run only schools with no processed_data (missing), or run all."
     )
+    parser.add_argument(
+        '--feed-format', choices=('json', 'jsonl'), default='json',
+        help="Raw output: the engine's JSON arrays (json), or one course per line "
+             "written as items arrive (jsonl)"
+    )
+    parser.add_argument(
+        '--max-spiders', type=int, default=0,
+        help="Most spiders crawling at once; the rest wait their turn (0 = no cap)"
+    )
+    parser.add_argument(
+        '--http-cache', choices=CACHE_MODES, default='on',
+        help="Cache responses under data/http_cache/ and revalidate them (on), fetch "
+             "everything afresh (off), or crawl from the cache alone, skipping "
+             "anything not in it (replay)"
+    )
     args = parser.parse_args()
 
     project_root = Path(__file__).resolve().parent.parent
@@ -65,23 +84,51 @@ def main():
         print("No scraper configs found under schools/*/scraping_configs/")
         return
 
-    # prepare Scrapy process
-    process = CrawlerProcess(get_project_settings())
-
+    scheduled = []
     for school_dir, cfg_path in configs:
         if args.mode == 'missing' and not needs_run(school_dir):
             print(f"Skipping {school_dir.name} (already has processed data)")
             continue
 
-        # load each config module (expects it to define `config = SpiderConfig(...)`)
+        # load each config module (expects it to define `config = SpiderConfig(...)`,
+        # and optionally per-school settings such as DOWNLOAD_DELAY)
         module = load_config_module(cfg_path)
-        engine = ScraperEngine(module.config)
+        scheduled.append((school_dir, module.config, spider_settings(module)))
+
+    # prepare Scrapy process
+    settings = get_project_settings()
+    for name, value in cache_settings(args.http_cache).items():
+        settings.set(name, value)
+    if args.http_cache == 'replay':
+        print(f"Replaying from {HTTP_CACHE_DIR}; pages not in it are skipped")
+    scratch = None
+    if args.feed_format == 'jsonl':
+        # items stream into raw_data/<spider>.jsonl; the engine's own array
+        # export goes to a scratch dir so downstream stages don't see it twice
+        settings.set('ITEM_PIPELINES', {
+            **settings.getdict('ITEM_PIPELINES'),
+            'report_tools.records.JsonLinesPipeline': 800,
+        })
+        settings.set('RAW_JSONL_DIRS', {
+            config.name: str(school_dir / "raw_data") for school_dir, config, _ in scheduled
+        })
+        scratch = tempfile.TemporaryDirectory(prefix="engine_feeds_")
+    process = CrawlerProcess(settings)
+    scheduler = CrawlScheduler(process, max_active=args.max_spiders)
+
+    for school_dir, config, overrides in scheduled:
+        engine = ScraperEngine(config)
         raw_data_dir = school_dir / "raw_data"
-        print(f"Scheduling scraper for: {school_dir.name}")
-        engine.schedule(process, output_dir=str(raw_data_dir))
+        if scratch:
+            raw_data_dir = Path(scratch.name) / school_dir.name
+        print(f"Scheduling scraper for: {school_dir.name}" + (f" {overrides}" if overrides else ""))
+        scheduler.overrides = overrides
+        engine.schedule(scheduler, output_dir=str(raw_data_dir))
 
     print("Starting crawl process...")
     process.start()
+    if scratch:
+        scratch.cleanup()
     print("All scrapers finished.")
 
 if __name__ == '__main__':
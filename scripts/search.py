@@ -0,0 +1,67 @@
+# scripts/search.py
+
+"""
+Full-text search over every school's course text, for trying out candidate
+taxonomy terms before adding them to phrases_spreadsheet.xlsx.
+
+Queries use SQLite FTS5 syntax:
+  python scripts/search.py '"fuel cell"'
+  python scripts/search.py '"fuel cell" AND (electrolysis OR electrolyzer) NOT biology'
+  python scripts/search.py 'NEAR(hydrogen storage, 5)' --by-school
+  python scripts/search.py 'catalys*' --category priority
+"""
+
+import sys
+from pathlib import Path
+
+# add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import argparse
+import sqlite3
+from report_tools.index import INDEX_DB
+from report_tools.search import count_by_school, search, update_search_index
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Search course titles/descriptions across all schools (FTS5 query syntax).",
+        epilog="Raw catalogs are indexed where raw_data still exists, otherwise processed rows.",
+    )
+    parser.add_argument('query', help='e.g. \'"fuel cell" AND electroly*\'')
+    parser.add_argument('--category', choices=('priority', 'non_priority'))
+    parser.add_argument('--school', help="Restrict to one school directory name")
+    parser.add_argument('--limit', type=int, default=20, help="Courses to list (default: 20)")
+    parser.add_argument('--by-school', action='store_true', help="Show hit counts per school instead of courses")
+    parser.add_argument('--no-update', action='store_true', help="Query the index as-is, skip the freshness check")
+    parser.add_argument('--rebuild', action='store_true', help="Re-index every school's text")
+    parser.add_argument('--db', type=Path, default=INDEX_DB)
+    args = parser.parse_args()
+
+    if args.no_update:
+        from report_tools.search import connect
+        conn = connect(args.db)
+    else:
+        conn = update_search_index(PROJECT_ROOT / "schools", args.db, force=args.rebuild)
+
+    try:
+        if args.by_school:
+            rows = count_by_school(conn, args.query, args.category, args.school)
+            total = sum(n for *_, n in rows)
+            for category, school, hits in rows:
+                print(f"{hits:6d}  {category}/{school}")
+            print(f"\n{total} matching course(s) in {len(rows)} school(s)")
+        else:
+            rows = search(conn, args.query, args.category, args.school, args.limit)
+            for category, school, origin, title, snippet in rows:
+                print(f"{category}/{school} ({origin})  {title}")
+                print(f"    {snippet}")
+            print(f"\n{len(rows)} result(s) shown")
+    except sqlite3.OperationalError as e:
+        print(f"Bad query {args.query!r}: {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# tests/test_process_data.py
+import importlib.util
+import json
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# scripts/ is not a package; load process_data.py (which sets up sys.path itself)
+_spec = importlib.util.spec_from_file_location("process_data", PROJECT_ROOT / "scripts" / "process_data.py")
+process_data = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_data)
+
+def _course(i, **fields):
+    return {"title": f"ENGR {i} - Automation", "description": "biofuels", **fields}
+
+def _run(tmp_path, name, records, chunk_size, monkeypatch):
+    school = tmp_path / name
+    (school / "raw_data").mkdir(parents=True)
+    (school / "raw_data" / "courses.json").write_text(json.dumps(records))
+    monkeypatch.setattr(process_data, "CHUNK_SIZE", chunk_size)
+    process_data.process_school(school, force=True)
+    return (school / "processed_data" / "processed.csv").read_text()
+
+def test_numeric_columns_consistent_across_chunks(tmp_path, monkeypatch):
+    # credits is an int column until the last records lack it: one DataFrame
+    # over everything makes it float, so every row must read 3.0
+    records = [_course(i, credits=3) for i in range(12)] + [_course(i) for i in range(12, 14)]
+    csv = _run(tmp_path, "chunked", records, 5, monkeypatch)
+    credits = pd.read_csv(tmp_path / "chunked" / "processed_data" / "processed.csv",
+                          dtype=str, keep_default_na=False)["credits"]
+    assert credits.tolist() == ["3.0"] * 12 + ["", ""]
+    assert csv == _run(tmp_path, "whole", records, 10**6, monkeypatch)
+
+def test_chunked_output_matches_unchunked(tmp_path, monkeypatch):
+    records = []
+    for i in range(25):
+        r = _course(i, credits=3, lab=True, hours=1.5, level=100)
+        if i >= 12:
+            r["seats"] = 30                 # field first seen in a later chunk
+        if i == 17:
+            r["description"] = "pottery"    # filtered out, and the only one without level
+            del r["level"]
+        if i == 23:
+            r["hours"] = "TBA"
+        records.append(r)
+    whole = _run(tmp_path, "whole", records, 10**6, monkeypatch)
+    for size in (5, 7, 12, 13):
+        assert _run(tmp_path, f"chunks_{size}", records, size, monkeypatch) == whole
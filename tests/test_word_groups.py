@@ -0,0 +1,55 @@
+# tests/test_word_groups.py
+import json
+import resource
+import sys
+from pathlib import Path
+
+# add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pandas as pd
+from report_tools.word_groups import KeywordMatcher, score_frame, text_column
+
+GROUPS = {
+    "data_science-3": ["data science", "data, analysis", "statistics"],
+    "math-2":         ["statistics", "algebra", "linear algebra"],
+    "writing":        ["writing", "technical writing"],
+}
+
+def _per_row(df, matcher):
+    texts = (text_column(df, "title") + " " + text_column(df, "description")).str.lower()
+    rows = []
+    for text in texts:
+        score, kws, groups, freqs = matcher.score_text(text)
+        rows.append((score, ";".join(kws), ";".join(groups), json.dumps(freqs, ensure_ascii=False)))
+    return rows
+
+def _frame_rows(df, matcher):
+    out = score_frame(df, matcher=matcher)
+    return list(out[["relevance_score", "matched_keywords",
+                     "matched_groups", "keyword_frequencies"]].itertuples(index=False, name=None))
+
+def test_score_frame_matches_score_text():
+    matcher = KeywordMatcher(GROUPS)
+    df = pd.DataFrame({
+        "title":       ["Linear Algebra", "Technical Writing", "Pottery", None, "", "Data Science"],
+        "description": ["Algebra and statistics, statistics.", "writing writing", "clay", "data analysis",
+                        None, "Data analysis with statistics and algebra"],
+    }, index=[10, 3, 7, 7, 0, 1])
+    assert _frame_rows(df, matcher) == _per_row(df, matcher)
+
+def test_score_frame_long_text_keeps_memory_flat():
+    # one very long description among many short ones must not blow up the
+    # whole chunk (e.g. by padding every row to its length)
+    matcher = KeywordMatcher(GROUPS)
+    df = pd.DataFrame({
+        "title":       ["Statistics"] * 5000,
+        "description": ["algebra for data science"] * 5000,
+    })
+    df.loc[0, "description"] = "data analysis statistics " * 2000   # ~50 KB
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rows = _frame_rows(df, matcher)
+    grown_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / 1024
+    assert rows == _per_row(df, matcher)
+    assert grown_mb < 200